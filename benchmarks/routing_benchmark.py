@@ -0,0 +1,91 @@
+import random
+import sys
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from routing.hostname_pattern_routing_index import HostnamePatternRoutingIndex
+from routing.request_hostname_pattern_proxy_routing import RequestHostnamePatternProxyRouting
+
+
+RULE_COUNTS: tuple[int, ...] = (10, 1_000, 100_000)
+LOOKUP_COUNT: int = 10_000
+LINEAR_RULE_EVALUATION_LIMIT: int = 1_000_000
+
+
+def build_routing_list(rule_count: int) -> list[RequestHostnamePatternProxyRouting]:
+    routing_list: list[RequestHostnamePatternProxyRouting] = []
+    rule_index: int
+    for rule_index in range(rule_count):
+        pattern: str
+        if rule_index % 100 == 0:
+            pattern = f'build-??.ci-{rule_index}.example.com'
+        elif rule_index % 2 == 0:
+            pattern = f'*.domain-{rule_index}.example.com'
+        else:
+            pattern = f'host-{rule_index}.example.com'
+        routing_list.append(
+            RequestHostnamePatternProxyRouting(request_hostname_pattern=pattern, proxy_id=f'proxy-{rule_index % 7}')
+        )
+    return routing_list
+
+
+def build_hostnames(rule_count: int, hostname_count: int) -> list[str]:
+    randomizer: random.Random = random.Random(rule_count)
+    hostnames: list[str] = []
+    while len(hostnames) < hostname_count:
+        rule_index: int = randomizer.randrange(rule_count)
+        if rule_index % 100 == 0:
+            hostnames.append(f'build-{rule_index % 100:02d}.ci-{rule_index}.example.com')
+        elif rule_index % 2 == 0:
+            hostnames.append(f'git.domain-{rule_index}.example.com')
+        else:
+            hostnames.append(f'host-{rule_index}.example.com')
+        hostnames.append(f'unknown-{rule_index}.example.org')
+    return hostnames[:hostname_count]
+
+
+def find_proxy_id_linear(routing_list: list[RequestHostnamePatternProxyRouting], hostname: str) -> str | None:
+    return next((x.proxy_id for x in routing_list if fnmatch(name=hostname, pat=x.request_hostname_pattern)), None)
+
+
+def measure_lookup_microseconds(find_proxy_id: Callable[[str], str | None], hostnames: list[str]) -> float:
+    start_time: float = time.perf_counter()
+    hostname: str
+    for hostname in hostnames:
+        find_proxy_id(hostname)
+    return (time.perf_counter() - start_time) / len(hostnames) * 1_000_000
+
+
+def main() -> None:
+    print(f'{"rules":>8} | {"build (ms)":>10} | {"linear (us/lookup)":>18} | {"index (us/lookup)":>17} | {"speedup":>8}')
+    rule_count: int
+    for rule_count in RULE_COUNTS:
+        routing_list: list[RequestHostnamePatternProxyRouting] = build_routing_list(rule_count)
+        hostnames: list[str] = build_hostnames(rule_count=rule_count, hostname_count=LOOKUP_COUNT)
+        start_time: float = time.perf_counter()
+        routing_index: HostnamePatternRoutingIndex = HostnamePatternRoutingIndex(routing_list)
+        build_milliseconds: float = (time.perf_counter() - start_time) * 1_000
+        linear_hostnames: list[str] = hostnames[:max(10, LINEAR_RULE_EVALUATION_LIMIT // rule_count)]
+        linear_microseconds: float = measure_lookup_microseconds(
+            find_proxy_id=lambda x: find_proxy_id_linear(routing_list, x),
+            hostnames=linear_hostnames
+        )
+        index_microseconds: float = measure_lookup_microseconds(
+            find_proxy_id=routing_index.find_proxy_id,
+            hostnames=hostnames
+        )
+        hostname: str
+        for hostname in linear_hostnames:
+            assert routing_index.find_proxy_id(hostname) == find_proxy_id_linear(routing_list, hostname)
+        print(
+            f'{rule_count:>8} | {build_milliseconds:>10.1f} | {linear_microseconds:>18.2f} | '
+            f'{index_microseconds:>17.2f} | {linear_microseconds / index_microseconds:>7.0f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
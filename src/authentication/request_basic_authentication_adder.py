@@ -2,36 +2,45 @@ import base64
 import logging
 from logging import Logger
 from pathlib import Path
-
-from aiopath import AsyncPath
-from pydantic import TypeAdapter
+from types import MappingProxyType
 
 from authentication.basic_authentication_credentials import BasicAuthenticationCredentials
 from authentication.credentials_not_found_exception import CredentialsNotFoundException
+from config_watching import ConfigFileWatcher
 from proxy_server import IRequestAuthenticationAdder, Request
 
 
 class RequestBasicAuthenticationAdder(IRequestAuthenticationAdder):
     _log: Logger = logging.getLogger(__name__)
-    _auth_config_file_path: AsyncPath
+    _auth_config_file_watcher: ConfigFileWatcher[
+        list[BasicAuthenticationCredentials],
+        MappingProxyType[str, BasicAuthenticationCredentials]
+    ]
 
-    def __init__(self, auth_config_file_path: Path) -> None:
-        self._auth_config_file_path = AsyncPath(auth_config_file_path)
+    def __init__(self, auth_config_file_path: Path, config_poll_interval_seconds: float = 1.0) -> None:
+        self._auth_config_file_watcher = ConfigFileWatcher(
+            config_file_path=auth_config_file_path,
+            config_type=list[BasicAuthenticationCredentials],
+            snapshot_builder=self._build_credentials_by_id,
+            poll_interval_seconds=config_poll_interval_seconds
+        )
 
     async def add_authentication_to_request(self, authentication_id: str, request: Request) -> None:
         self._log.debug('Adding basic authentication headers...')
-        async with self._auth_config_file_path.open(mode='r') as file:
-            credentials: list[BasicAuthenticationCredentials] = TypeAdapter(
-                list[BasicAuthenticationCredentials]
-            ).validate_json(await file.read())
-        proxy_credentials: BasicAuthenticationCredentials | None = next(
-            (x for x in credentials if x.id == authentication_id),
-            None
+        credentials_by_id: MappingProxyType[str, BasicAuthenticationCredentials] = (
+            await self._auth_config_file_watcher.get_snapshot()
         )
+        proxy_credentials: BasicAuthenticationCredentials | None = credentials_by_id.get(authentication_id)
         if proxy_credentials is None:
             raise CredentialsNotFoundException(authentication_id)
-        encoded_credentials: str = (
-            base64.b64encode(f'{proxy_credentials.username}:{proxy_credentials.password}'.encode()).decode()
+        encoded_credentials: bytes = (
+            base64.b64encode(f'{proxy_credentials.username}:{proxy_credentials.password}'.encode())
         )
-        request.headers['Proxy-Authorization'] = f'Basic {encoded_credentials}'
+        request.header_overrides['Proxy-Authorization'] = b'Basic ' + encoded_credentials
         self._log.debug('Basic authentication headers added')
+
+    @staticmethod
+    def _build_credentials_by_id(
+        credentials: list[BasicAuthenticationCredentials]
+    ) -> MappingProxyType[str, BasicAuthenticationCredentials]:
+        return MappingProxyType({x.id: x for x in reversed(credentials)})
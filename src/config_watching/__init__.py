@@ -0,0 +1 @@
+from .config_file_watcher import ConfigFileWatcher
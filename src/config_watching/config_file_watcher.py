@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from asyncio import Lock
+from logging import Logger
+from os import stat_result
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+from aiopath import AsyncPath
+from pydantic import TypeAdapter
+
+
+ConfigT = TypeVar('ConfigT')
+SnapshotT = TypeVar('SnapshotT')
+
+
+class ConfigFileWatcher(Generic[ConfigT, SnapshotT]):
+    _log: Logger = logging.getLogger(__name__)
+    _config_file_path: AsyncPath
+    _type_adapter: TypeAdapter[ConfigT]
+    _snapshot_builder: Callable[[ConfigT], SnapshotT]
+    _poll_interval_seconds: float
+    _snapshot: SnapshotT | None
+    _file_signature: tuple[int, int, int] | None
+    _next_poll_time: float
+    _load_lock: Lock
+
+    def __init__(
+        self,
+        config_file_path: Path,
+        config_type: type[ConfigT],
+        snapshot_builder: Callable[[ConfigT], SnapshotT],
+        poll_interval_seconds: float = 1.0
+    ) -> None:
+        self._config_file_path = AsyncPath(config_file_path)
+        self._type_adapter = TypeAdapter(config_type)
+        self._snapshot_builder = snapshot_builder
+        self._poll_interval_seconds = poll_interval_seconds
+        self._snapshot = None
+        self._file_signature = None
+        self._next_poll_time = 0.0
+        self._load_lock = Lock()
+
+    async def get_snapshot(self) -> SnapshotT:
+        if self._snapshot is None:
+            async with self._load_lock:
+                if self._snapshot is None:
+                    await self._load()
+        else:
+            now: float = asyncio.get_running_loop().time()
+            if now >= self._next_poll_time:
+                self._next_poll_time = now + self._poll_interval_seconds
+                await self._reload_if_changed()
+        return self._snapshot
+
+    async def _reload_if_changed(self) -> None:
+        try:
+            file_signature: tuple[int, int, int] = await self._get_file_signature()
+            if file_signature != self._file_signature:
+                await self._load()
+        except Exception as ex:
+            self._log.error(
+                f'Error reloading {self._config_file_path}, keeping last valid configuration: '
+                f'{ex.__class__.__name__} - {ex}'
+            )
+
+    async def _load(self) -> None:
+        self._log.debug(f'Loading configuration from {self._config_file_path}...')
+        self._file_signature = await self._get_file_signature()
+        self._next_poll_time = asyncio.get_running_loop().time() + self._poll_interval_seconds
+        async with self._config_file_path.open(mode='r') as file:
+            config: ConfigT = self._type_adapter.validate_json(await file.read())
+        self._snapshot = self._snapshot_builder(config)
+        self._log.info(f'Configuration loaded from {self._config_file_path}')
+
+    async def _get_file_signature(self) -> tuple[int, int, int]:
+        file_stat: stat_result = await self._config_file_path.stat()
+        return file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
@@ -19,12 +19,26 @@ if __name__ == '__main__':
         proxy_logging_builder.build()
         proxy_server: ProxyServer = ProxyServer(
             proxy_config_file_path=settings.proxy_config_file_path,
-            proxy_router=RequestHostnamePatternProxyRouter(settings.routing_config_file_path),
+            proxy_router=RequestHostnamePatternProxyRouter(
+                routing_config_file_path=settings.routing_config_file_path,
+                config_poll_interval_seconds=settings.config_poll_interval_seconds
+            ),
             host=settings.proxy_server_host,
             port=settings.proxy_server_port,
             timeout_seconds=settings.proxy_server_timeout_seconds,
             buffer_size_bytes=settings.proxy_server_buffer_size_bytes,
-            request_authentication_adder=RequestBasicAuthenticationAdder(settings.authentication_config_file_path)
+            max_request_head_size_bytes=settings.proxy_server_max_request_head_size_bytes,
+            request_authentication_adder=RequestBasicAuthenticationAdder(
+                auth_config_file_path=settings.authentication_config_file_path,
+                config_poll_interval_seconds=settings.config_poll_interval_seconds
+            ),
+            config_poll_interval_seconds=settings.config_poll_interval_seconds,
+            proxy_pool_max_size=settings.proxy_server_pool_max_size,
+            proxy_pool_idle_ttl_seconds=settings.proxy_server_pool_idle_ttl_seconds,
+            keep_alive_timeout_seconds=settings.proxy_server_keep_alive_timeout_seconds,
+            keep_alive_max_requests=settings.proxy_server_keep_alive_max_requests,
+            tunnel_max_chunk_size_bytes=settings.proxy_server_tunnel_max_chunk_size_bytes,
+            tunnel_high_water_mark_bytes=settings.proxy_server_tunnel_high_water_mark_bytes
         )
         asyncio.run(proxy_server.start())
     except Exception as ex:
@@ -11,19 +11,37 @@ class Connection:
     _timeout_seconds: float = 60.0
     _buffer_size_bytes: int = 4096
 
-    async def read(self) -> bytes | None:
+    async def read(self, max_size_bytes: int | None = None, timeout_seconds: float | None = None) -> bytes | None:
         if self._reader is None:
             raise NotImplementedError('No reader was found')
         else:
             try:
                 return await asyncio.wait_for(
-                    fut=self._reader.read(self._buffer_size_bytes),
-                    timeout=self._timeout_seconds
+                    fut=self._reader.read(
+                        self._buffer_size_bytes if max_size_bytes is None
+                        else min(max_size_bytes, self._buffer_size_bytes)
+                    ),
+                    timeout=self._timeout_seconds if timeout_seconds is None else timeout_seconds
                 )
             except TimeoutError:
                 self._log.debug('TimeoutError raised on bytes stream reading')
                 return None
 
+    async def read_until(self, separator: bytes, timeout_seconds: float | None = None) -> bytes:
+        if self._reader is None:
+            raise NotImplementedError('No reader was found')
+        else:
+            return await asyncio.wait_for(
+                fut=self._reader.readuntil(separator),
+                timeout=self._timeout_seconds if timeout_seconds is None else timeout_seconds
+            )
+
+    async def read_available(self, max_size_bytes: int) -> bytes:
+        if self._reader is None:
+            raise NotImplementedError('No reader was found')
+        else:
+            return await self._reader.read(max_size_bytes)
+
     async def write(self, data: bytes) -> None:
         if self._writer is None:
             raise NotImplementedError('No writer was found')
@@ -34,6 +52,21 @@ class Connection:
             except ConnectionError:
                 self._log.debug('ConnectionError raised on bytes stream writing')
 
+    async def write_buffered(self, data: bytes, high_water_mark_bytes: int) -> bool:
+        if self._writer is None:
+            raise NotImplementedError('No writer was found')
+        elif self._writer.is_closing():
+            return False
+        else:
+            self._writer.write(data)
+            if self._writer.transport.get_write_buffer_size() > high_water_mark_bytes:
+                try:
+                    await self._writer.drain()
+                except ConnectionError:
+                    self._log.debug('ConnectionError raised on bytes stream draining')
+                    return False
+            return True
+
     async def close(self) -> None:
         if self._writer is None:
             raise NotImplementedError('No writer was found')
@@ -43,3 +76,12 @@ class Connection:
                 await self._writer.wait_closed()
             except ConnectionError:
                 self._log.debug('ConnectionError raised on bytes stream closing')
+
+    def is_reusable(self) -> bool:
+        return (
+            self._reader is not None
+            and self._writer is not None
+            and not self._reader.at_eof()
+            and self._reader.exception() is None
+            and not self._writer.is_closing()
+        )
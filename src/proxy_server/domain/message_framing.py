@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class MessageFraming(StrEnum):
+    chunked = 'CHUNKED'
+    content_length = 'CONTENT_LENGTH'
+    no_body = 'NO_BODY'
+    tunnel = 'TUNNEL'
+    until_close = 'UNTIL_CLOSE'
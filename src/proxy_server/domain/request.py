@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 
+from proxy_server.domain.message_framing import MessageFraming
 from proxy_server.domain.request_method import RequestMethod
 
 
@@ -9,5 +10,9 @@ class Request:
     target: str
     http_version: str
     headers: dict[str, str] = field(default_factory=dict)
-    body: str | None = field(default=None, repr=False)
     hostname: str | None = field(default=None, repr=False)
+    framing: MessageFraming = field(default=MessageFraming.no_body, repr=False)
+    content_length: int | None = field(default=None, repr=False)
+    keep_alive: bool = field(default=False, repr=False)
+    raw_headers: bytes = field(default=b'', repr=False)
+    header_overrides: dict[str, bytes] = field(default_factory=dict, repr=False)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+from proxy_server.domain.message_framing import MessageFraming
+
+
+@dataclass
+class Response:
+    http_version: str
+    status_code: int
+    reason: str
+    headers: dict[str, str] = field(default_factory=dict, repr=False)
+    framing: MessageFraming = field(default=MessageFraming.until_close, repr=False)
+    content_length: int | None = field(default=None, repr=False)
+    keep_alive: bool = field(default=False, repr=False)
@@ -0,0 +1,3 @@
+class InvalidRequestException(Exception):
+    def __init__(self, reason: str) -> None:
+        super().__init__(f'Invalid request: {reason}')
@@ -0,0 +1,3 @@
+class RequestHeadTooLargeException(Exception):
+    def __init__(self, max_size_bytes: int) -> None:
+        super().__init__(f'Request head exceeds {max_size_bytes} bytes')
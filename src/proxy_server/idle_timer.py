@@ -0,0 +1,41 @@
+import asyncio
+from asyncio import AbstractEventLoop, TimerHandle
+from typing import Callable
+
+
+class IdleTimer:
+    _loop: AbstractEventLoop
+    _timeout_seconds: float
+    _callback: Callable[[], object] | None = None
+    _timer_handle: TimerHandle | None = None
+    _last_activity_time: float
+    _expired: bool = False
+
+    def __init__(self, timeout_seconds: float) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._timeout_seconds = timeout_seconds
+        self._last_activity_time = self._loop.time()
+
+    def start(self, callback: Callable[[], object]) -> None:
+        self._callback = callback
+        self._timer_handle = self._loop.call_at(self._last_activity_time + self._timeout_seconds, self._on_timer)
+
+    def touch(self) -> None:
+        self._last_activity_time = self._loop.time()
+
+    def cancel(self) -> None:
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+    def is_expired(self) -> bool:
+        return self._expired
+
+    def _on_timer(self) -> None:
+        deadline: float = self._last_activity_time + self._timeout_seconds
+        if self._loop.time() < deadline:
+            self._timer_handle = self._loop.call_at(deadline, self._on_timer)
+        else:
+            self._timer_handle = None
+            self._expired = True
+            self._callback()
@@ -0,0 +1,59 @@
+import logging
+from asyncio import IncompleteReadError
+from logging import Logger
+
+from proxy_server.domain.connection import Connection
+from proxy_server.domain.message_framing import MessageFraming
+
+
+class MessageBodyForwarder:
+    _log: Logger = logging.getLogger(__name__)
+
+    async def forward_body(
+        self,
+        framing: MessageFraming,
+        source: Connection,
+        destination: Connection,
+        content_length: int | None = None
+    ) -> None:
+        self._log.debug(f'Forwarding {framing} message body from {source} to {destination}...')
+        match framing:
+            case MessageFraming.content_length:
+                await self._forward_bytes(source=source, destination=destination, size_bytes=content_length)
+            case MessageFraming.chunked:
+                await self._forward_chunks(source=source, destination=destination)
+            case MessageFraming.until_close:
+                await self._forward_until_close(source=source, destination=destination)
+        self._log.debug(f'Message body forwarded from {source} to {destination}')
+
+    @staticmethod
+    async def _forward_bytes(source: Connection, destination: Connection, size_bytes: int) -> None:
+        remaining_bytes: int = size_bytes
+        while remaining_bytes > 0:
+            data: bytes | None = await source.read(remaining_bytes)
+            if not data:
+                raise IncompleteReadError(partial=b'', expected=remaining_bytes)
+            await destination.write(data)
+            remaining_bytes -= len(data)
+
+    async def _forward_chunks(self, source: Connection, destination: Connection) -> None:
+        while True:
+            chunk_size_line: bytes = await source.read_until(b'\r\n')
+            await destination.write(chunk_size_line)
+            chunk_size_bytes: int = int(chunk_size_line.split(sep=b';', maxsplit=1)[0], 16)
+            if chunk_size_bytes == 0:
+                break
+            await self._forward_bytes(source=source, destination=destination, size_bytes=chunk_size_bytes + 2)
+        while True:
+            trailer_line: bytes = await source.read_until(b'\r\n')
+            await destination.write(trailer_line)
+            if trailer_line == b'\r\n':
+                break
+
+    @staticmethod
+    async def _forward_until_close(source: Connection, destination: Connection) -> None:
+        while True:
+            data: bytes | None = await source.read()
+            if not data:
+                break
+            await destination.write(data)
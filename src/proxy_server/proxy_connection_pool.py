@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from collections import deque
+from logging import Logger
+
+from proxy_server.domain.proxy import Proxy
+
+
+class ProxyConnectionPool:
+    _log: Logger = logging.getLogger(__name__)
+    _max_size: int
+    _idle_ttl_seconds: float
+    _idle_proxies: dict[tuple[str, str, int], deque[tuple[float, Proxy]]]
+
+    def __init__(self, max_size: int = 8, idle_ttl_seconds: float = 30.0) -> None:
+        self._max_size = max_size
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._idle_proxies = {}
+
+    async def acquire(self, proxy: Proxy) -> Proxy | None:
+        idle_proxies: deque[tuple[float, Proxy]] | None = self._idle_proxies.get(self._get_pool_key(proxy))
+        now: float = asyncio.get_running_loop().time()
+        while idle_proxies:
+            idle_since: float
+            idle_proxy: Proxy
+            idle_since, idle_proxy = idle_proxies.pop()
+            if now - idle_since < self._idle_ttl_seconds and idle_proxy.is_reusable():
+                self._log.debug(f'Reusing pooled connection with {idle_proxy}')
+                return idle_proxy
+            await idle_proxy.close()
+        return None
+
+    async def release(self, proxy: Proxy) -> None:
+        pool_key: tuple[str, str, int] = self._get_pool_key(proxy)
+        idle_proxies: deque[tuple[float, Proxy]] = self._idle_proxies.setdefault(pool_key, deque())
+        now: float = asyncio.get_running_loop().time()
+        while idle_proxies and now - idle_proxies[0][0] >= self._idle_ttl_seconds:
+            await idle_proxies.popleft()[1].close()
+        if len(idle_proxies) < self._max_size and proxy.is_reusable():
+            idle_proxies.append((now, proxy))
+            self._log.debug(f'Connection with {proxy} returned to pool')
+        else:
+            await proxy.close()
+
+    @staticmethod
+    def _get_pool_key(proxy: Proxy) -> tuple[str, str, int]:
+        return proxy.id, proxy.hostname, proxy.port
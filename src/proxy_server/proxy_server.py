@@ -1,22 +1,27 @@
 import asyncio
 import logging
-from asyncio import Server, StreamReader, StreamWriter
+from asyncio import IncompleteReadError, LimitOverrunError, Server, StreamReader, StreamWriter, Task
 from contextvars import ContextVar
 from logging import Logger
 from pathlib import Path
+from types import MappingProxyType
 from uuid import UUID, uuid4
 
-from aiopath import AsyncPath
-from pydantic import TypeAdapter
-
+from config_watching import ConfigFileWatcher
 from proxy_server.domain.client import Client
-from proxy_server.domain.connection import Connection
+from proxy_server.domain.message_framing import MessageFraming
 from proxy_server.domain.proxy import Proxy
 from proxy_server.domain.request import Request
 from proxy_server.domain.request_method import RequestMethod
+from proxy_server.domain.response import Response
 from proxy_server.exceptions.empty_request_exception import EmptyRequestException
 from proxy_server.exceptions.proxy_not_found_exception import ProxyNotFoundException
+from proxy_server.exceptions.request_head_too_large_exception import RequestHeadTooLargeException
+from proxy_server.message_body_forwarder import MessageBodyForwarder
+from proxy_server.proxy_connection_pool import ProxyConnectionPool
 from proxy_server.request_adapter import RequestAdapter
+from proxy_server.response_adapter import ResponseAdapter
+from proxy_server.tunnel_engine import TunnelEngine
 from proxy_server.services.i_proxy_router import IProxyRouter
 from proxy_server.services.i_request_authentication_adder import IRequestAuthenticationAdder
 
@@ -26,14 +31,31 @@ request_id_context: ContextVar[UUID | None] = ContextVar('request_id', default=N
 
 class ProxyServer:
     _log: Logger = logging.getLogger(__name__)
-    _proxy_config_file_path: AsyncPath
+    _idempotent_request_methods: frozenset[RequestMethod] = frozenset(
+        {
+            RequestMethod.delete,
+            RequestMethod.get,
+            RequestMethod.head,
+            RequestMethod.options,
+            RequestMethod.put,
+            RequestMethod.trace
+        }
+    )
+    _proxy_config_file_watcher: ConfigFileWatcher[list[Proxy], MappingProxyType[str, Proxy]]
     _proxy_router: IProxyRouter
     _host: str
     _port: int
     _timeout_seconds: float
     _buffer_size_bytes: int
+    _max_request_head_size_bytes: int
     _request_adapter: RequestAdapter
+    _response_adapter: ResponseAdapter
+    _message_body_forwarder: MessageBodyForwarder
     _request_authentication_adder: IRequestAuthenticationAdder | None
+    _proxy_connection_pool: ProxyConnectionPool
+    _keep_alive_timeout_seconds: float
+    _keep_alive_max_requests: int
+    _tunnel_engine: TunnelEngine
 
     def __init__(
         self,
@@ -43,24 +65,54 @@ class ProxyServer:
         port: int = 8888,
         timeout_seconds: float = 60.0,
         buffer_size_bytes: int = 4096,
+        max_request_head_size_bytes: int = 65536,
         request_adapter: RequestAdapter = RequestAdapter(),
-        request_authentication_adder: IRequestAuthenticationAdder | None = None
+        response_adapter: ResponseAdapter = ResponseAdapter(),
+        message_body_forwarder: MessageBodyForwarder = MessageBodyForwarder(),
+        request_authentication_adder: IRequestAuthenticationAdder | None = None,
+        config_poll_interval_seconds: float = 1.0,
+        proxy_pool_max_size: int = 8,
+        proxy_pool_idle_ttl_seconds: float = 30.0,
+        keep_alive_timeout_seconds: float = 15.0,
+        keep_alive_max_requests: int = 100,
+        tunnel_max_chunk_size_bytes: int = 262144,
+        tunnel_high_water_mark_bytes: int = 262144
     ) -> None:
-        self._proxy_config_file_path = AsyncPath(proxy_config_file_path)
+        self._proxy_config_file_watcher = ConfigFileWatcher(
+            config_file_path=proxy_config_file_path,
+            config_type=list[Proxy],
+            snapshot_builder=self._build_proxies_by_id,
+            poll_interval_seconds=config_poll_interval_seconds
+        )
         self._proxy_router = proxy_router
         self._host = host
         self._port = port
         self._timeout_seconds = timeout_seconds
         self._buffer_size_bytes = buffer_size_bytes
+        self._max_request_head_size_bytes = max_request_head_size_bytes
         self._request_adapter = request_adapter
+        self._response_adapter = response_adapter
+        self._message_body_forwarder = message_body_forwarder
         self._request_authentication_adder = request_authentication_adder
+        self._proxy_connection_pool = ProxyConnectionPool(
+            max_size=proxy_pool_max_size,
+            idle_ttl_seconds=proxy_pool_idle_ttl_seconds
+        )
+        self._keep_alive_timeout_seconds = keep_alive_timeout_seconds
+        self._keep_alive_max_requests = keep_alive_max_requests
+        self._tunnel_engine = TunnelEngine(
+            min_chunk_size_bytes=buffer_size_bytes,
+            max_chunk_size_bytes=tunnel_max_chunk_size_bytes,
+            high_water_mark_bytes=tunnel_high_water_mark_bytes
+        )
 
     async def start(self) -> None:
         self._log.info('Starting server...')
         server: Server = await asyncio.start_server(
             client_connected_cb=self.handle_request,
             host=self._host,
-            port=self._port
+            port=self._port,
+            limit=self._max_request_head_size_bytes
         )
         async with server:
             self._log.info(f'Server is running on http://{self._host}:{self._port}')
@@ -68,9 +120,6 @@ class ProxyServer:
 
     async def handle_request(self, client_reader: StreamReader, client_writer: StreamWriter) -> None:
         client: Client | None = None
-        proxy: Proxy | None = None
-        request_id_context.set(uuid4())
-        self._log.info('Handling new request...')
         try:
             client: Client = Client(
                 reader=client_reader,
@@ -78,44 +127,172 @@ class ProxyServer:
                 timeout_seconds=self._timeout_seconds,
                 buffer_size_bytes=self._buffer_size_bytes
             )
-            request: Request | None = self._request_adapter.adapt_request_from_bytes(await client.read())
+            handled_request_count: int = 0
+            while await self._handle_client_request(client=client, keep_alive_request=handled_request_count > 0):
+                handled_request_count += 1
+                if handled_request_count >= self._keep_alive_max_requests:
+                    self._log.debug(f'Closing client connection after {handled_request_count} requests')
+                    break
+        finally:
+            if client is not None:
+                await client.close()
+
+    async def _handle_client_request(self, client: Client, keep_alive_request: bool) -> bool:
+        proxy: Proxy | None = None
+        request_body_task: Task[None] | None = None
+        keep_alive: bool = False
+        request_id_context.set(uuid4())
+        try:
+            request_head: bytes | None = await self._read_request_head(
+                client=client,
+                keep_alive_request=keep_alive_request
+            )
+            if request_head is None and keep_alive_request:
+                self._log.debug('Client connection closed while idle')
+                return False
+            self._log.info('Handling new request...')
+            request: Request | None = self._request_adapter.adapt_request_from_bytes(request_head)
             if request is None:
                 raise EmptyRequestException
             self._log.info(f'Handling {request}...')
             proxy_id: str = await self._proxy_router.route_request_to_proxy(request)
-            async with self._proxy_config_file_path.open(mode='r') as file:
-                proxies: list[Proxy] = TypeAdapter(list[Proxy]).validate_json(await file.read())
-            proxy = next((x for x in proxies if x.id == proxy_id), None)
-            if proxy is None:
+            proxies_by_id: MappingProxyType[str, Proxy] = await self._proxy_config_file_watcher.get_snapshot()
+            if proxy_id not in proxies_by_id:
                 raise ProxyNotFoundException(proxy_id)
+            proxy_config: Proxy = proxies_by_id[proxy_id]
             if self._request_authentication_adder is not None:
                 await self._request_authentication_adder.add_authentication_to_request(
-                    authentication_id=proxy.authentication_id,
+                    authentication_id=proxy_config.authentication_id,
                     request=request
                 )
-            await proxy.connect(timeout_seconds=self._timeout_seconds, buffer_size_bytes=self._buffer_size_bytes)
-            await proxy.write(self._request_adapter.adapt_request_to_bytes(request))
+            request_head = self._request_adapter.adapt_request_to_bytes(request)
             if request.method == RequestMethod.connect:
-                await asyncio.gather(
-                    self._tunnel_data(source=client, destination=proxy),
-                    self._tunnel_data(source=proxy, destination=client)
-                )
+                proxy = await self._connect_proxy(proxy_config)
+                await proxy.write(request_head)
+                await self._tunnel_engine.tunnel(client=client, proxy=proxy, idle_timeout_seconds=self._timeout_seconds)
             else:
-                await self._tunnel_data(source=proxy, destination=client)
+                response_head: bytes
+                proxy, response_head, request_body_task = await self._send_request(
+                    proxy_config=proxy_config,
+                    request=request,
+                    request_head=request_head,
+                    client=client
+                )
+                response: Response = await self._forward_response(
+                    request=request,
+                    response_head=response_head,
+                    proxy=proxy,
+                    client=client
+                )
+                if request_body_task is not None:
+                    await request_body_task
+                if response.keep_alive:
+                    await self._proxy_connection_pool.release(proxy)
+                    proxy = None
+                keep_alive = request.keep_alive and response.keep_alive
             self._log.info('Request handled successfully')
         except Exception as ex:
             self._log.error(f'Error handling request: {ex.__class__.__name__} - {ex}')
+            keep_alive = False
         finally:
-            if client is not None:
-                await client.close()
+            if request_body_task is not None and not request_body_task.done():
+                request_body_task.cancel()
             if proxy is not None:
                 await proxy.close()
+        return keep_alive
+
+    async def _read_request_head(self, client: Client, keep_alive_request: bool) -> bytes | None:
+        try:
+            return await client.read_until(
+                separator=b'\r\n\r\n',
+                timeout_seconds=self._keep_alive_timeout_seconds if keep_alive_request else self._timeout_seconds
+            )
+        except IncompleteReadError as ex:
+            if ex.partial:
+                raise
+            return None
+        except TimeoutError:
+            if keep_alive_request:
+                return None
+            raise
+        except LimitOverrunError:
+            raise RequestHeadTooLargeException(self._max_request_head_size_bytes)
+
+    async def _connect_proxy(self, proxy_config: Proxy) -> Proxy:
+        proxy: Proxy = proxy_config.model_copy()
+        await proxy.connect(timeout_seconds=self._timeout_seconds, buffer_size_bytes=self._buffer_size_bytes)
+        return proxy
+
+    async def _send_request(
+        self,
+        proxy_config: Proxy,
+        request: Request,
+        request_head: bytes,
+        client: Client
+    ) -> tuple[Proxy, bytes, Task[None] | None]:
+        if request.framing == MessageFraming.no_body and request.method in self._idempotent_request_methods:
+            pooled_proxy: Proxy | None = await self._proxy_connection_pool.acquire(proxy_config)
+            if pooled_proxy is not None:
+                try:
+                    await pooled_proxy.write(request_head)
+                    return pooled_proxy, await pooled_proxy.read_until(b'\r\n\r\n'), None
+                except (ConnectionError, IncompleteReadError) as ex:
+                    self._log.debug(f'Pooled connection with {pooled_proxy} lost: {ex.__class__.__name__} - {ex}')
+                    await pooled_proxy.close()
+                except Exception:
+                    await pooled_proxy.close()
+                    raise
+        proxy: Proxy = await self._connect_proxy(proxy_config)
+        request_body_task: Task[None] | None = None
+        try:
+            await proxy.write(request_head)
+            if request.framing != MessageFraming.no_body:
+                request_body_task = asyncio.create_task(
+                    self._message_body_forwarder.forward_body(
+                        framing=request.framing,
+                        source=client,
+                        destination=proxy,
+                        content_length=request.content_length
+                    )
+                )
+            return proxy, await proxy.read_until(b'\r\n\r\n'), request_body_task
+        except Exception:
+            if request_body_task is not None:
+                request_body_task.cancel()
+            await proxy.close()
+            raise
+
+    async def _forward_response(
+        self,
+        request: Request,
+        response_head: bytes,
+        proxy: Proxy,
+        client: Client
+    ) -> Response:
+        response: Response = self._response_adapter.adapt_response_from_bytes(
+            response=response_head,
+            request_method=request.method
+        )
+        while 100 <= response.status_code < 200 and response.framing != MessageFraming.tunnel:
+            await client.write(response_head)
+            response_head = await proxy.read_until(b'\r\n\r\n')
+            response = self._response_adapter.adapt_response_from_bytes(
+                response=response_head,
+                request_method=request.method
+            )
+        self._log.debug(f'Forwarding {response}...')
+        await client.write(response_head)
+        if response.framing == MessageFraming.tunnel:
+            await self._tunnel_engine.tunnel(client=client, proxy=proxy, idle_timeout_seconds=self._timeout_seconds)
+        else:
+            await self._message_body_forwarder.forward_body(
+                framing=response.framing,
+                source=proxy,
+                destination=client,
+                content_length=response.content_length
+            )
+        return response
 
-    async def _tunnel_data(self, source: Connection, destination: Connection) -> None:
-        self._log.debug(f'Tunneling data from {source} to {destination}...')
-        while True:
-            data: bytes = await source.read()
-            if not data:
-                break
-            await destination.write(data)
-        self._log.debug(f'Tunneling data from {source} to {destination} finished')
+    @staticmethod
+    def _build_proxies_by_id(proxies: list[Proxy]) -> MappingProxyType[str, Proxy]:
+        return MappingProxyType({x.id: x for x in reversed(proxies)})
@@ -1,5 +1,7 @@
+from proxy_server.domain.message_framing import MessageFraming
 from proxy_server.domain.request import Request
 from proxy_server.domain.request_method import RequestMethod
+from proxy_server.exceptions.invalid_request_exception import InvalidRequestException
 
 
 class RequestAdapter:
@@ -8,27 +10,22 @@ class RequestAdapter:
         if not request:
             return None
 
-        lines: list[str] = request.decode().splitlines()
+        start_line_size_bytes: int = request.find(b'\r\n') + 2
+        lines: list[str] = request.decode(encoding='latin-1').split('\r\n')
         start_line: list[str] = lines[0].split()
         method: str = start_line[0]
         target: str = start_line[1]
         http_version: str = start_line[2]
 
         headers: dict[str, str] = {}
-        body: str | None = None
-        in_headers: bool = True
         line: str
         for line in lines[1:]:
-            if in_headers:
-                if line == '':
-                    in_headers = False
-                else:
-                    key: str
-                    value: str
-                    key, value = line.split(sep=':', maxsplit=1)
-                    headers[key.strip()] = value.strip()
-            else:
-                body = line if body is None else body + '\n' + line
+            if line == '':
+                break
+            key: str
+            value: str
+            key, value = line.split(sep=':', maxsplit=1)
+            headers[key.strip()] = value.strip()
 
         address: str
         if 'Host' in headers:
@@ -39,21 +36,63 @@ class RequestAdapter:
 
         hostname: str = address.split(sep=':')[0] if ':' in address else address
 
+        lower_case_headers: dict[str, str] = {key.lower(): value for key, value in headers.items()}
+        framing: MessageFraming = MessageFraming.no_body
+        content_length: int | None = None
+        if 'transfer-encoding' in lower_case_headers:
+            transfer_codings: list[str] = [
+                x.strip().lower() for x in lower_case_headers['transfer-encoding'].split(',')
+            ]
+            if transfer_codings[-1] != 'chunked':
+                raise InvalidRequestException('chunked must be the final transfer coding')
+            framing = MessageFraming.chunked
+        elif 'content-length' in lower_case_headers:
+            if not lower_case_headers['content-length'].isdigit():
+                raise InvalidRequestException(f'invalid Content-Length \'{lower_case_headers["content-length"]}\'')
+            content_length = int(lower_case_headers['content-length'])
+            framing = MessageFraming.content_length if content_length > 0 else MessageFraming.no_body
+
+        connection_options: set[str] = {
+            x.strip().lower()
+            for key in ('connection', 'proxy-connection')
+            for x in lower_case_headers.get(key, '').split(',')
+        }
+        keep_alive: bool = (
+            'close' not in connection_options
+            and (http_version != 'HTTP/1.0' or 'keep-alive' in connection_options)
+        )
+
         return Request(
             method=RequestMethod(method),
             target=target,
             http_version=http_version,
             headers=headers,
-            body=body,
-            hostname=hostname
+            hostname=hostname,
+            framing=framing,
+            content_length=content_length,
+            keep_alive=keep_alive,
+            raw_headers=request[start_line_size_bytes:]
         )
 
     @staticmethod
     def adapt_request_to_bytes(request: Request) -> bytes:
-        start_line_string: str = f'{request.method.value} {request.target} {request.http_version}\r\n'
-        headers_string: str = '\r\n'.join([f'{key}: {value}' for key, value in request.headers.items()])
-        headers_string += '\r\n' if headers_string else ''
-        request_string: str = start_line_string + headers_string + '\r\n'
-        if request.body is not None:
-            request_string += request.body
-        return request_string.encode()
+        start_line: bytes = f'{request.method.value} {request.target} {request.http_version}\r\n'.encode(
+            encoding='latin-1'
+        )
+        if request.raw_headers and not request.header_overrides:
+            return start_line + request.raw_headers
+
+        header_lines: list[bytes]
+        if request.raw_headers:
+            header_lines = [] if request.raw_headers == b'\r\n' else request.raw_headers[:-4].split(b'\r\n')
+        else:
+            header_lines = [f'{key}: {value}'.encode(encoding='latin-1') for key, value in request.headers.items()]
+        if request.header_overrides:
+            overridden_keys: set[bytes] = {key.lower().encode(encoding='latin-1') for key in request.header_overrides}
+            header_lines = [
+                x for x in header_lines if x.split(sep=b':', maxsplit=1)[0].strip().lower() not in overridden_keys
+            ]
+            header_lines.extend(
+                key.encode(encoding='latin-1') + b': ' + value for key, value in request.header_overrides.items()
+            )
+        return start_line + b''.join(x + b'\r\n' for x in header_lines) + b'\r\n'
@@ -0,0 +1,57 @@
+from proxy_server.domain.message_framing import MessageFraming
+from proxy_server.domain.request_method import RequestMethod
+from proxy_server.domain.response import Response
+
+
+class ResponseAdapter:
+    @staticmethod
+    def adapt_response_from_bytes(response: bytes, request_method: RequestMethod) -> Response:
+        lines: list[str] = response.decode(encoding='latin-1').split('\r\n')
+        status_line: list[str] = lines[0].split(maxsplit=2)
+        http_version: str = status_line[0]
+        status_code: int = int(status_line[1])
+        reason: str = status_line[2] if len(status_line) > 2 else ''
+
+        headers: dict[str, str] = {}
+        line: str
+        for line in lines[1:]:
+            if line == '':
+                break
+            key: str
+            value: str
+            key, value = line.split(sep=':', maxsplit=1)
+            key = key.strip().lower()
+            value = value.strip()
+            headers[key] = f'{headers[key]}, {value}' if key in headers else value
+
+        framing: MessageFraming
+        content_length: int | None = None
+        if status_code == 101:
+            framing = MessageFraming.tunnel
+        elif request_method == RequestMethod.head or 100 <= status_code < 200 or status_code in (204, 304):
+            framing = MessageFraming.no_body
+        elif 'transfer-encoding' in headers:
+            transfer_codings: list[str] = [x.strip().lower() for x in headers['transfer-encoding'].split(',')]
+            framing = MessageFraming.chunked if transfer_codings[-1] == 'chunked' else MessageFraming.until_close
+        elif 'content-length' in headers:
+            framing = MessageFraming.content_length
+            content_length = int(headers['content-length'].split(',')[0])
+        else:
+            framing = MessageFraming.until_close
+
+        connection_options: set[str] = {x.strip().lower() for x in headers.get('connection', '').split(',')}
+        keep_alive: bool = (
+            framing not in (MessageFraming.tunnel, MessageFraming.until_close)
+            and 'close' not in connection_options
+            and (http_version != 'HTTP/1.0' or 'keep-alive' in connection_options)
+        )
+
+        return Response(
+            http_version=http_version,
+            status_code=status_code,
+            reason=reason,
+            headers=headers,
+            framing=framing,
+            content_length=content_length,
+            keep_alive=keep_alive
+        )
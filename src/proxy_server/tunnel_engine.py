@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from asyncio import CancelledError, Future
+from logging import Logger
+
+from proxy_server.domain.connection import Connection
+from proxy_server.idle_timer import IdleTimer
+
+
+class TunnelEngine:
+    _log: Logger = logging.getLogger(__name__)
+    _min_chunk_size_bytes: int
+    _max_chunk_size_bytes: int
+    _high_water_mark_bytes: int
+
+    def __init__(
+        self,
+        min_chunk_size_bytes: int = 4096,
+        max_chunk_size_bytes: int = 262144,
+        high_water_mark_bytes: int = 262144
+    ) -> None:
+        self._min_chunk_size_bytes = min_chunk_size_bytes
+        self._max_chunk_size_bytes = max(min_chunk_size_bytes, max_chunk_size_bytes)
+        self._high_water_mark_bytes = high_water_mark_bytes
+
+    async def tunnel(self, client: Connection, proxy: Connection, idle_timeout_seconds: float) -> None:
+        self._log.debug(f'Tunneling data between {client} and {proxy}...')
+        idle_timer: IdleTimer = IdleTimer(idle_timeout_seconds)
+        tunnel_future: Future[list[int]] = asyncio.gather(
+            self._pipe(source=client, destination=proxy, idle_timer=idle_timer),
+            self._pipe(source=proxy, destination=client, idle_timer=idle_timer)
+        )
+        idle_timer.start(tunnel_future.cancel)
+        try:
+            upstream_size_bytes: int
+            downstream_size_bytes: int
+            upstream_size_bytes, downstream_size_bytes = await tunnel_future
+            self._log.debug(
+                f'Tunneling data between {client} and {proxy} finished '
+                f'({upstream_size_bytes} bytes sent, {downstream_size_bytes} bytes received)'
+            )
+        except CancelledError:
+            if not idle_timer.is_expired():
+                raise
+            self._log.debug(f'Tunnel between {client} and {proxy} closed after {idle_timeout_seconds} s idle')
+        finally:
+            idle_timer.cancel()
+
+    async def _pipe(self, source: Connection, destination: Connection, idle_timer: IdleTimer) -> int:
+        chunk_size_bytes: int = self._min_chunk_size_bytes
+        forwarded_size_bytes: int = 0
+        while True:
+            try:
+                data: bytes = await source.read_available(chunk_size_bytes)
+            except ConnectionError as ex:
+                self._log.debug(f'Tunnel source {source} lost: {ex.__class__.__name__} - {ex}')
+                break
+            if not data:
+                break
+            idle_timer.touch()
+            forwarded_size_bytes += len(data)
+            if not await destination.write_buffered(data=data, high_water_mark_bytes=self._high_water_mark_bytes):
+                break
+            if len(data) == chunk_size_bytes:
+                chunk_size_bytes = min(chunk_size_bytes * 2, self._max_chunk_size_bytes)
+            elif len(data) < chunk_size_bytes // 4:
+                chunk_size_bytes = max(chunk_size_bytes // 2, self._min_chunk_size_bytes)
+        return forwarded_size_bytes
@@ -0,0 +1,9 @@
+from dataclasses import dataclass, field
+from re import Pattern
+
+
+@dataclass(slots=True)
+class HostnameLabelTrieNode:
+    children: dict[str, 'HostnameLabelTrieNode'] = field(default_factory=dict)
+    routing_index: int | None = None
+    glob_routing_regex: Pattern[str] | None = None
@@ -0,0 +1,117 @@
+import re
+from fnmatch import translate
+from re import Match, Pattern
+from typing import Iterable
+
+from routing.hostname_label_trie_node import HostnameLabelTrieNode
+from routing.request_hostname_pattern_proxy_routing import RequestHostnamePatternProxyRouting
+
+
+class HostnamePatternRoutingIndex:
+    _glob_characters: frozenset[str] = frozenset('*?[]')
+    _proxy_ids: tuple[str, ...]
+    _exact_routing_indexes: dict[str, int]
+    _suffix_routing_trie: HostnameLabelTrieNode
+    _glob_routing_regex: Pattern[str] | None
+
+    def __init__(self, routing_list: Iterable[RequestHostnamePatternProxyRouting]) -> None:
+        proxy_ids: list[str] = []
+        self._exact_routing_indexes = {}
+        self._suffix_routing_trie = HostnameLabelTrieNode()
+        glob_regex_parts: list[str] = []
+        trie_glob_regex_parts: dict[int, tuple[HostnameLabelTrieNode, list[str]]] = {}
+        routing_index: int
+        routing: RequestHostnamePatternProxyRouting
+        node: HostnameLabelTrieNode
+        for routing_index, routing in enumerate(routing_list):
+            proxy_ids.append(routing.proxy_id)
+            pattern: str = routing.request_hostname_pattern
+            if not self._has_glob_characters(pattern):
+                self._exact_routing_indexes.setdefault(pattern, routing_index)
+            elif pattern.startswith('*.') and len(pattern) > 2 and not self._has_glob_characters(pattern[2:]):
+                node = self._get_or_add_trie_node(pattern[2:])
+                if node.routing_index is None:
+                    node.routing_index = routing_index
+            else:
+                glob_regex_part: str = f'(?P<r{routing_index}>{translate(pattern)})'
+                literal_suffix: str | None = self._get_glob_literal_suffix(pattern)
+                if literal_suffix is None:
+                    glob_regex_parts.append(glob_regex_part)
+                else:
+                    node = self._get_or_add_trie_node(literal_suffix)
+                    trie_glob_regex_parts.setdefault(id(node), (node, []))[1].append(glob_regex_part)
+        self._proxy_ids = tuple(proxy_ids)
+        self._glob_routing_regex = re.compile('|'.join(glob_regex_parts)) if glob_regex_parts else None
+        node_glob_regex_parts: list[str]
+        for node, node_glob_regex_parts in trie_glob_regex_parts.values():
+            node.glob_routing_regex = re.compile('|'.join(node_glob_regex_parts))
+
+    def __len__(self) -> int:
+        return len(self._proxy_ids)
+
+    def find_proxy_id(self, hostname: str) -> str | None:
+        routing_index: int | None = self._exact_routing_indexes.get(hostname)
+        trie_routing_index: int | None = self._find_trie_routing_index(hostname)
+        if trie_routing_index is not None and (routing_index is None or trie_routing_index < routing_index):
+            routing_index = trie_routing_index
+        glob_routing_index: int | None = self._match_glob_routing_regex(
+            glob_routing_regex=self._glob_routing_regex,
+            hostname=hostname
+        )
+        if glob_routing_index is not None and (routing_index is None or glob_routing_index < routing_index):
+            routing_index = glob_routing_index
+        return None if routing_index is None else self._proxy_ids[routing_index]
+
+    def _get_or_add_trie_node(self, suffix: str) -> HostnameLabelTrieNode:
+        node: HostnameLabelTrieNode = self._suffix_routing_trie
+        label: str
+        for label in reversed(suffix.split('.')):
+            child: HostnameLabelTrieNode | None = node.children.get(label)
+            if child is None:
+                child = HostnameLabelTrieNode()
+                node.children[label] = child
+            node = child
+        return node
+
+    def _find_trie_routing_index(self, hostname: str) -> int | None:
+        result: int | None = None
+        labels: list[str] = hostname.split('.')
+        node: HostnameLabelTrieNode | None = self._suffix_routing_trie
+        label_index: int
+        for label_index in range(len(labels) - 1, 0, -1):
+            node = node.children.get(labels[label_index])
+            if node is None:
+                break
+            node_routing_index: int | None = node.routing_index
+            if node.glob_routing_regex is not None:
+                glob_routing_index: int | None = self._match_glob_routing_regex(
+                    glob_routing_regex=node.glob_routing_regex,
+                    hostname=hostname
+                )
+                if glob_routing_index is not None and (
+                    node_routing_index is None or glob_routing_index < node_routing_index
+                ):
+                    node_routing_index = glob_routing_index
+            if node_routing_index is not None and (result is None or node_routing_index < result):
+                result = node_routing_index
+        return result
+
+    @classmethod
+    def _has_glob_characters(cls, pattern: str) -> bool:
+        return not cls._glob_characters.isdisjoint(pattern)
+
+    @classmethod
+    def _get_glob_literal_suffix(cls, pattern: str) -> str | None:
+        last_glob_character_index: int = max(pattern.rfind(x) for x in cls._glob_characters)
+        literal_tail: str = pattern[last_glob_character_index + 1:]
+        separator_index: int = literal_tail.find('.')
+        if separator_index == -1 or separator_index == len(literal_tail) - 1:
+            return None
+        return literal_tail[separator_index + 1:]
+
+    @staticmethod
+    def _match_glob_routing_regex(glob_routing_regex: Pattern[str] | None, hostname: str) -> int | None:
+        if glob_routing_regex is None:
+            return None
+        match: Match[str] | None = glob_routing_regex.match(hostname)
+        return None if match is None else int(match.lastgroup[1:])
@@ -1,33 +1,34 @@
 import logging
-from fnmatch import fnmatch
 from logging import Logger
 from pathlib import Path
 
-from aiopath import AsyncPath
-from pydantic import TypeAdapter
-
+from config_watching import ConfigFileWatcher
 from proxy_server import IProxyRouter, Request
+from routing.hostname_pattern_routing_index import HostnamePatternRoutingIndex
 from routing.proxy_routing_not_found_exception import ProxyRoutingNotFoundException
 from routing.request_hostname_pattern_proxy_routing import RequestHostnamePatternProxyRouting
 
 
 class RequestHostnamePatternProxyRouter(IProxyRouter):
     _log: Logger = logging.getLogger(__name__)
-    _routing_config_file_path: AsyncPath
+    _routing_config_file_watcher: ConfigFileWatcher[
+        list[RequestHostnamePatternProxyRouting],
+        HostnamePatternRoutingIndex
+    ]
 
-    def __init__(self, routing_config_file_path: Path) -> None:
-        self._routing_config_file_path = AsyncPath(routing_config_file_path)
+    def __init__(self, routing_config_file_path: Path, config_poll_interval_seconds: float = 1.0) -> None:
+        self._routing_config_file_watcher = ConfigFileWatcher(
+            config_file_path=routing_config_file_path,
+            config_type=list[RequestHostnamePatternProxyRouting],
+            snapshot_builder=HostnamePatternRoutingIndex,
+            poll_interval_seconds=config_poll_interval_seconds
+        )
 
     async def route_request_to_proxy(self, request: Request) -> str:
         self._log.debug(f'Getting proxy for hostname \'{request.hostname}\'...')
-        async with self._routing_config_file_path.open(mode='r') as file:
-            routing_list: list[RequestHostnamePatternProxyRouting] = TypeAdapter(
-                list[RequestHostnamePatternProxyRouting]
-            ).validate_json(await file.read())
-        routing: RequestHostnamePatternProxyRouting
-        for routing in routing_list:
-            if fnmatch(name=request.hostname, pat=routing.request_hostname_pattern):
-                result: str = routing.proxy_id
-                self._log.debug(f'Proxy for hostname \'{request.hostname}\' retrieved')
-                return result
-        raise ProxyRoutingNotFoundException(request.hostname)
+        routing_index: HostnamePatternRoutingIndex = await self._routing_config_file_watcher.get_snapshot()
+        result: str | None = None if request.hostname is None else routing_index.find_proxy_id(request.hostname)
+        if result is None:
+            raise ProxyRoutingNotFoundException(request.hostname)
+        self._log.debug(f'Proxy for hostname \'{request.hostname}\' retrieved')
+        return result
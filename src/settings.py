@@ -6,10 +6,30 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     authentication_config_file_path: Path = Field(alias='AUTH_CONFIG_FILE_PATH', default='/app/auth.json')
+    config_poll_interval_seconds: float = Field(alias='CONFIG_POLL_INTERVAL_SECONDS', default=1.0)
     logging_level: str = Field(alias='LOGGING_LEVEL', default='INFO')
     proxy_config_file_path: Path = Field(alias='PROXY_CONFIG_FILE_PATH', default='/app/proxy.json')
     proxy_server_buffer_size_bytes: int = Field(alias='PROXY_SERVER_BUFFER_SIZE_BYTES', default=4096)
     proxy_server_host: str = Field(alias='PROXY_SERVER_HOST', default='0.0.0.0')
+    proxy_server_keep_alive_max_requests: int = Field(alias='PROXY_SERVER_KEEP_ALIVE_MAX_REQUESTS', default=100)
+    proxy_server_keep_alive_timeout_seconds: float = Field(
+        alias='PROXY_SERVER_KEEP_ALIVE_TIMEOUT_SECONDS',
+        default=15.0
+    )
+    proxy_server_max_request_head_size_bytes: int = Field(
+        alias='PROXY_SERVER_MAX_REQUEST_HEAD_SIZE_BYTES',
+        default=65536
+    )
+    proxy_server_pool_idle_ttl_seconds: float = Field(alias='PROXY_SERVER_POOL_IDLE_TTL_SECONDS', default=30.0)
+    proxy_server_pool_max_size: int = Field(alias='PROXY_SERVER_POOL_MAX_SIZE', default=8)
     proxy_server_port: int = Field(alias='PROXY_SERVER_PORT', default=8888)
     proxy_server_timeout_seconds: float = Field(alias='PROXY_SERVER_TIMEOUT_SECONDS', default=60.0)
+    proxy_server_tunnel_high_water_mark_bytes: int = Field(
+        alias='PROXY_SERVER_TUNNEL_HIGH_WATER_MARK_BYTES',
+        default=262144
+    )
+    proxy_server_tunnel_max_chunk_size_bytes: int = Field(
+        alias='PROXY_SERVER_TUNNEL_MAX_CHUNK_SIZE_BYTES',
+        default=262144
+    )
     routing_config_file_path: Path = Field(alias='ROUTING_CONFIG_FILE_PATH', default='/app/routing.json')
@@ -0,0 +1,77 @@
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from config_watching.config_file_watcher import ConfigFileWatcher
+from routing.request_hostname_pattern_proxy_routing import RequestHostnamePatternProxyRouting
+
+
+@pytest.fixture(scope='function')
+def config_file_path_mock(tmp_path: Path) -> Path:
+    config_file_path: Path = tmp_path / 'routing.json'
+    config_file_path.write_text('[{"requestHostnamePattern": "*.test-domain.com", "proxyId": "test-proxy"}]')
+    return config_file_path
+
+
+@pytest.fixture(scope='function')
+def config_file_watcher(
+    config_file_path_mock: Path
+) -> ConfigFileWatcher[list[RequestHostnamePatternProxyRouting], tuple[RequestHostnamePatternProxyRouting, ...]]:
+    return ConfigFileWatcher(
+        config_file_path=config_file_path_mock,
+        config_type=list[RequestHostnamePatternProxyRouting],
+        snapshot_builder=tuple,
+        poll_interval_seconds=0.0
+    )
+
+
+def _rewrite_config_file(config_file_path: Path, content: str) -> None:
+    previous_mtime_ns: int = config_file_path.stat().st_mtime_ns
+    config_file_path.write_text(content)
+    os.utime(config_file_path, ns=(previous_mtime_ns + 1_000_000_000, previous_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_is_cached_until_file_changes(config_file_watcher: ConfigFileWatcher) -> None:
+    first_snapshot: tuple[RequestHostnamePatternProxyRouting, ...] = await config_file_watcher.get_snapshot()
+    second_snapshot: tuple[RequestHostnamePatternProxyRouting, ...] = await config_file_watcher.get_snapshot()
+    assert first_snapshot is second_snapshot
+    assert first_snapshot[0].proxy_id == 'test-proxy'
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_reloads_changed_file(
+    config_file_path_mock: Path,
+    config_file_watcher: ConfigFileWatcher
+) -> None:
+    first_snapshot: tuple[RequestHostnamePatternProxyRouting, ...] = await config_file_watcher.get_snapshot()
+    _rewrite_config_file(
+        config_file_path_mock,
+        '[{"requestHostnamePattern": "*.test-domain.com", "proxyId": "other-proxy"}]'
+    )
+    second_snapshot: tuple[RequestHostnamePatternProxyRouting, ...] = await config_file_watcher.get_snapshot()
+    assert first_snapshot[0].proxy_id == 'test-proxy'
+    assert second_snapshot[0].proxy_id == 'other-proxy'
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_keeps_last_valid_snapshot_on_invalid_file(
+    config_file_path_mock: Path,
+    config_file_watcher: ConfigFileWatcher
+) -> None:
+    first_snapshot: tuple[RequestHostnamePatternProxyRouting, ...] = await config_file_watcher.get_snapshot()
+    _rewrite_config_file(config_file_path_mock, '[{"requestHostnamePattern": "*.test-domain.com"')
+    second_snapshot: tuple[RequestHostnamePatternProxyRouting, ...] = await config_file_watcher.get_snapshot()
+    assert second_snapshot is first_snapshot
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_invalid_file_without_valid_snapshot(
+    config_file_path_mock: Path,
+    config_file_watcher: ConfigFileWatcher
+) -> None:
+    config_file_path_mock.write_text('[{"proxyId": "test-proxy"}]')
+    with pytest.raises(ValidationError):
+        await config_file_watcher.get_snapshot()
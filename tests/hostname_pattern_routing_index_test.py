@@ -0,0 +1,69 @@
+from fnmatch import fnmatch
+
+import pytest
+
+from routing.hostname_pattern_routing_index import HostnamePatternRoutingIndex
+from routing.request_hostname_pattern_proxy_routing import RequestHostnamePatternProxyRouting
+
+
+ROUTING_LIST: list[RequestHostnamePatternProxyRouting] = [
+    RequestHostnamePatternProxyRouting(request_hostname_pattern=pattern, proxy_id=proxy_id)
+    for pattern, proxy_id in [
+        ('pxy-internet.my-company-domain.com', 'internet-proxy'),
+        ('*.my-company-domain.com', 'company-proxy'),
+        ('api.external-domain.com', 'shadowed-proxy'),
+        ('*.external-domain.com', 'external-proxy'),
+        ('*.api.external-domain.com', 'shadowed-proxy'),
+        ('build-??.ci-domain.com', 'ci-proxy'),
+        ('*.ci-domain.com', 'ci-fallback-proxy'),
+        ('registry.*', 'registry-proxy'),
+        ('[ab]*.mirror-domain.com', 'mirror-proxy'),
+        ('*', 'default-proxy')
+    ]
+]
+
+
+@pytest.fixture(scope='function')
+def hostname_pattern_routing_index() -> HostnamePatternRoutingIndex:
+    return HostnamePatternRoutingIndex(ROUTING_LIST)
+
+
+@pytest.mark.parametrize(
+    argnames='hostname',
+    argvalues=[
+        'pxy-internet.my-company-domain.com',
+        'git.my-company-domain.com',
+        'a.b.my-company-domain.com',
+        '.my-company-domain.com',
+        'my-company-domain.com',
+        'api.external-domain.com',
+        'v1.api.external-domain.com',
+        'build-01.ci-domain.com',
+        'build-001.ci-domain.com',
+        'registry.npmjs.org',
+        'alpha.mirror-domain.com',
+        'gamma.mirror-domain.com',
+        'example.com',
+        ''
+    ]
+)
+def test_find_proxy_id_matches_first_fnmatch_routing(
+    hostname_pattern_routing_index: HostnamePatternRoutingIndex,
+    hostname: str
+) -> None:
+    expected_proxy_id: str | None = next(
+        (x.proxy_id for x in ROUTING_LIST if fnmatch(name=hostname, pat=x.request_hostname_pattern)),
+        None
+    )
+    assert hostname_pattern_routing_index.find_proxy_id(hostname) == expected_proxy_id
+
+
+def test_find_proxy_id_no_match() -> None:
+    hostname_pattern_routing_index: HostnamePatternRoutingIndex = HostnamePatternRoutingIndex(ROUTING_LIST[:-1])
+    assert hostname_pattern_routing_index.find_proxy_id('example.com') is None
+
+
+def test_find_proxy_id_suffix_requires_label_before_suffix(
+    hostname_pattern_routing_index: HostnamePatternRoutingIndex
+) -> None:
+    assert hostname_pattern_routing_index.find_proxy_id('my-company-domain.com') == 'default-proxy'
@@ -0,0 +1,75 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from proxy_server.domain.proxy import Proxy
+from proxy_server.proxy_connection_pool import ProxyConnectionPool
+
+
+@pytest.fixture(scope='function')
+def proxy_config() -> Proxy:
+    return Proxy(id='test-proxy', hostname='test.test-domain.com', port=80, authentication_id='test-user')
+
+
+def _create_proxy_mock(proxy_config: Proxy, reusable: bool = True) -> AsyncMock:
+    proxy: AsyncMock = AsyncMock(spec=Proxy)
+    proxy.id = proxy_config.id
+    proxy.hostname = proxy_config.hostname
+    proxy.port = proxy_config.port
+    proxy.is_reusable.return_value = reusable
+    return proxy
+
+
+@pytest.mark.asyncio
+async def test_acquire_empty_pool(proxy_config: Proxy) -> None:
+    proxy_connection_pool: ProxyConnectionPool = ProxyConnectionPool()
+    assert await proxy_connection_pool.acquire(proxy_config) is None
+
+
+@pytest.mark.asyncio
+async def test_acquire_released_proxy(proxy_config: Proxy) -> None:
+    proxy_connection_pool: ProxyConnectionPool = ProxyConnectionPool()
+    proxy_mock: AsyncMock = _create_proxy_mock(proxy_config)
+    await proxy_connection_pool.release(proxy_mock)
+    assert await proxy_connection_pool.acquire(proxy_config) is proxy_mock
+    assert await proxy_connection_pool.acquire(proxy_config) is None
+    proxy_mock.close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_acquire_discards_unhealthy_proxy(proxy_config: Proxy) -> None:
+    proxy_connection_pool: ProxyConnectionPool = ProxyConnectionPool()
+    proxy_mock: AsyncMock = _create_proxy_mock(proxy_config)
+    await proxy_connection_pool.release(proxy_mock)
+    proxy_mock.is_reusable.return_value = False
+    assert await proxy_connection_pool.acquire(proxy_config) is None
+    proxy_mock.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_acquire_discards_expired_proxy(proxy_config: Proxy) -> None:
+    proxy_connection_pool: ProxyConnectionPool = ProxyConnectionPool(idle_ttl_seconds=0.0)
+    proxy_mock: AsyncMock = _create_proxy_mock(proxy_config)
+    await proxy_connection_pool.release(proxy_mock)
+    assert await proxy_connection_pool.acquire(proxy_config) is None
+    proxy_mock.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_release_closes_proxy_over_max_size(proxy_config: Proxy) -> None:
+    proxy_connection_pool: ProxyConnectionPool = ProxyConnectionPool(max_size=1)
+    first_proxy_mock: AsyncMock = _create_proxy_mock(proxy_config)
+    second_proxy_mock: AsyncMock = _create_proxy_mock(proxy_config)
+    await proxy_connection_pool.release(first_proxy_mock)
+    await proxy_connection_pool.release(second_proxy_mock)
+    first_proxy_mock.close.assert_not_awaited()
+    second_proxy_mock.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_release_closes_unhealthy_proxy(proxy_config: Proxy) -> None:
+    proxy_connection_pool: ProxyConnectionPool = ProxyConnectionPool()
+    proxy_mock: AsyncMock = _create_proxy_mock(proxy_config=proxy_config, reusable=False)
+    await proxy_connection_pool.release(proxy_mock)
+    proxy_mock.close.assert_awaited_once()
+    assert await proxy_connection_pool.acquire(proxy_config) is None
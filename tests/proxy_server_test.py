@@ -1,10 +1,11 @@
-from asyncio import Server, StreamReader, StreamWriter
+from asyncio import IncompleteReadError, Server, StreamReader, StreamWriter
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 from pydantic import TypeAdapter
 
+from proxy_server.domain.message_framing import MessageFraming
 from proxy_server.domain.proxy import Proxy
 from proxy_server.domain.request import Request
 from proxy_server.domain.request_method import RequestMethod
@@ -18,6 +19,8 @@ HOST: str = '0.0.0.0'
 PORT: int = 8888
 TIMEOUT_SECONDS: float = 60.0
 BUFFER_SIZE_BYTES: int = 4096
+MAX_REQUEST_HEAD_SIZE_BYTES: int = 65536
+CLIENT_CLOSED: IncompleteReadError = IncompleteReadError(partial=b'', expected=None)
 
 
 @pytest.fixture(scope='function')
@@ -33,7 +36,10 @@ def proxy_config_file_path_mock(tmp_path: Path) -> Path:
 def proxy_mock() -> AsyncMock:
     proxy: AsyncMock = AsyncMock(spec=Proxy)
     proxy.id = 'test-proxy'
+    proxy.hostname = 'test.test-domain.com'
+    proxy.port = 80
     proxy.authentication_id = 'test-user'
+    proxy.model_copy.return_value = proxy
     return proxy
 
 
@@ -75,6 +81,7 @@ async def test_start(
         proxy_router=proxy_router_mock,
         host=HOST,
         port=PORT,
+        max_request_head_size_bytes=MAX_REQUEST_HEAD_SIZE_BYTES,
         request_adapter=request_adapter_mock
     )
     asyncio_start_server_mock: AsyncMock
@@ -85,7 +92,8 @@ async def test_start(
         asyncio_start_server_mock.assert_awaited_once_with(
             client_connected_cb=proxy_server.handle_request,
             host=HOST,
-            port=PORT
+            port=PORT,
+            limit=MAX_REQUEST_HEAD_SIZE_BYTES
         )
         server_mock.serve_forever.assert_awaited_once()
 
@@ -100,14 +108,14 @@ async def test_handle_request_http(
     client_reader_mock: AsyncMock,
     client_writer_mock: AsyncMock
 ) -> None:
-    request_bytes: bytes = (
+    request_head_bytes: bytes = (
         b'POST /submit HTTP/1.1\r\n'
         b'Host: content.test-domain.com\r\n'
         b'Content-Type: application/json\r\n'
-        b'Content-Length: 18\r\n'
+        b'Content-Length: 16\r\n'
         b'\r\n'
-        b'{"key": "value"}'
     )
+    request_body_bytes: bytes = b'{"key": "value"}'
     request: Request = Request(
         method=RequestMethod.post,
         target='/submit',
@@ -117,21 +125,25 @@ async def test_handle_request_http(
             'Content-Type': 'application/json',
             'Content-Length': '16'
         },
-        body='{"key": "value"}',
-        hostname='content.test-domain.com'
+        hostname='content.test-domain.com',
+        framing=MessageFraming.content_length,
+        content_length=16
     )
-    response_bytes: bytes = (
+    response_head_bytes: bytes = (
         b'HTTP/1.1 200 OK\r\n'
         b'Content-Type: text/plain\r\n'
-        b'Content-Length: 31'
+        b'Content-Length: 31\r\n'
         b'\r\n'
-        b'Message submitted successfully.'
     )
-    proxy_mock.read.side_effect = [response_bytes, b'']
+    response_body_bytes: bytes = b'Message submitted successfully.'
+    proxy_mock.read_until.return_value = response_head_bytes
+    proxy_mock.read.return_value = response_body_bytes
+    proxy_mock.is_reusable.return_value = True
     proxy_router_mock.route_request_to_proxy.return_value = 'test-proxy'
     request_adapter_mock.adapt_request_from_bytes.return_value = request
-    request_adapter_mock.adapt_request_to_bytes.return_value = request_bytes
-    client_reader_mock.read.return_value = request_bytes
+    request_adapter_mock.adapt_request_to_bytes.return_value = request_head_bytes
+    client_reader_mock.readuntil.return_value = request_head_bytes
+    client_reader_mock.read.return_value = request_body_bytes
     proxy_server: ProxyServer = ProxyServer(
         proxy_config_file_path=proxy_config_file_path_mock,
         proxy_router=proxy_router_mock,
@@ -146,23 +158,218 @@ async def test_handle_request_http(
             timeout_seconds=TIMEOUT_SECONDS,
             buffer_size_bytes=BUFFER_SIZE_BYTES
         )
-        proxy_mock.write.assert_awaited_once_with(request_bytes)
-        assert proxy_mock.read.await_count == 2
-        proxy_mock.close.assert_awaited_once()
+        assert proxy_mock.write.await_args_list == [call(request_head_bytes), call(request_body_bytes)]
+        proxy_mock.read_until.assert_awaited_once_with(b'\r\n\r\n')
+        proxy_mock.read.assert_awaited_once_with(31)
+        proxy_mock.close.assert_not_awaited()
         proxy_router_mock.route_request_to_proxy.assert_awaited_once_with(request)
-        request_adapter_mock.adapt_request_from_bytes.assert_called_once_with(request_bytes)
+        request_adapter_mock.adapt_request_from_bytes.assert_called_once_with(request_head_bytes)
         request_adapter_mock.adapt_request_to_bytes.assert_called_once_with(request)
         request_authentication_adder_mock.add_authentication_to_request.assert_awaited_once_with(
             authentication_id=proxy_mock.authentication_id,
             request=request
         )
-        client_reader_mock.read.assert_awaited_once_with(BUFFER_SIZE_BYTES)
-        client_writer_mock.write.assert_called_once_with(response_bytes)
-        client_writer_mock.drain.assert_awaited_once()
+        client_reader_mock.readuntil.assert_awaited_once_with(b'\r\n\r\n')
+        client_reader_mock.read.assert_awaited_once_with(16)
+        assert client_writer_mock.write.call_args_list == [call(response_head_bytes), call(response_body_bytes)]
+        assert client_writer_mock.drain.await_count == 2
         client_writer_mock.close.assert_called_once()
         client_writer_mock.wait_closed.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_handle_request_http_reuses_pooled_proxy_connection(
+    proxy_config_file_path_mock: Path,
+    proxy_mock: AsyncMock,
+    proxy_router_mock: AsyncMock,
+    request_adapter_mock: Mock,
+    client_reader_mock: AsyncMock,
+    client_writer_mock: AsyncMock
+) -> None:
+    request_bytes: bytes = (
+        b'GET http://content.test-domain.com/ HTTP/1.1\r\n'
+        b'Host: content.test-domain.com\r\n'
+        b'\r\n'
+    )
+    request: Request = Request(
+        method=RequestMethod.get,
+        target='http://content.test-domain.com/',
+        http_version='HTTP/1.1',
+        headers={
+            'Host': 'content.test-domain.com'
+        },
+        hostname='content.test-domain.com'
+    )
+    response_head_bytes: bytes = (
+        b'HTTP/1.1 200 OK\r\n'
+        b'Transfer-Encoding: chunked\r\n'
+        b'\r\n'
+    )
+    proxy_mock.read_until.side_effect = [response_head_bytes, b'2\r\n', b'0\r\n', b'\r\n'] * 2
+    proxy_mock.read.side_effect = [b'OK\r\n'] * 2
+    proxy_mock.is_reusable.return_value = True
+    request_adapter_mock.adapt_request_from_bytes.return_value = request
+    request_adapter_mock.adapt_request_to_bytes.return_value = request_bytes
+    client_reader_mock.readuntil.return_value = request_bytes
+    proxy_server: ProxyServer = ProxyServer(
+        proxy_config_file_path=proxy_config_file_path_mock,
+        proxy_router=proxy_router_mock,
+        timeout_seconds=TIMEOUT_SECONDS,
+        buffer_size_bytes=BUFFER_SIZE_BYTES,
+        request_adapter=request_adapter_mock
+    )
+    with patch.object(target=TypeAdapter, attribute=TypeAdapter.validate_json.__name__, return_value=[proxy_mock]):
+        await proxy_server.handle_request(client_reader=client_reader_mock, client_writer=client_writer_mock)
+        await proxy_server.handle_request(client_reader=client_reader_mock, client_writer=client_writer_mock)
+        proxy_mock.connect.assert_awaited_once()
+        assert proxy_mock.write.await_args_list == [call(request_bytes)] * 2
+        proxy_mock.close.assert_not_awaited()
+        assert client_writer_mock.write.call_args_list == [
+            call(response_head_bytes),
+            call(b'2\r\n'),
+            call(b'OK\r\n'),
+            call(b'0\r\n'),
+            call(b'\r\n')
+        ] * 2
+
+
+@pytest.mark.asyncio
+async def test_handle_request_http_closes_non_persistent_proxy_connection(
+    proxy_config_file_path_mock: Path,
+    proxy_mock: AsyncMock,
+    proxy_router_mock: AsyncMock,
+    request_adapter_mock: Mock,
+    client_reader_mock: AsyncMock,
+    client_writer_mock: AsyncMock
+) -> None:
+    request_bytes: bytes = (
+        b'GET http://content.test-domain.com/ HTTP/1.1\r\n'
+        b'Host: content.test-domain.com\r\n'
+        b'\r\n'
+    )
+    request: Request = Request(
+        method=RequestMethod.get,
+        target='http://content.test-domain.com/',
+        http_version='HTTP/1.1',
+        headers={
+            'Host': 'content.test-domain.com'
+        },
+        hostname='content.test-domain.com',
+        keep_alive=True
+    )
+    response_head_bytes: bytes = (
+        b'HTTP/1.1 200 OK\r\n'
+        b'Connection: close\r\n'
+        b'\r\n'
+    )
+    proxy_mock.read_until.return_value = response_head_bytes
+    proxy_mock.read.side_effect = [b'Hello world!', b'']
+    request_adapter_mock.adapt_request_from_bytes.return_value = request
+    request_adapter_mock.adapt_request_to_bytes.return_value = request_bytes
+    client_reader_mock.readuntil.return_value = request_bytes
+    proxy_server: ProxyServer = ProxyServer(
+        proxy_config_file_path=proxy_config_file_path_mock,
+        proxy_router=proxy_router_mock,
+        timeout_seconds=TIMEOUT_SECONDS,
+        buffer_size_bytes=BUFFER_SIZE_BYTES,
+        request_adapter=request_adapter_mock
+    )
+    with patch.object(target=TypeAdapter, attribute=TypeAdapter.validate_json.__name__, return_value=[proxy_mock]):
+        await proxy_server.handle_request(client_reader=client_reader_mock, client_writer=client_writer_mock)
+        proxy_mock.write.assert_awaited_once_with(request_bytes)
+        assert proxy_mock.read.await_count == 2
+        proxy_mock.close.assert_awaited_once()
+        client_reader_mock.readuntil.assert_awaited_once()
+        assert client_writer_mock.write.call_args_list == [call(response_head_bytes), call(b'Hello world!')]
+        client_writer_mock.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_request_http_keep_alive(
+    proxy_config_file_path_mock: Path,
+    proxy_mock: AsyncMock,
+    proxy_router_mock: AsyncMock,
+    request_adapter_mock: Mock,
+    client_reader_mock: AsyncMock,
+    client_writer_mock: AsyncMock
+) -> None:
+    request_bytes: bytes = (
+        b'GET http://content.test-domain.com/ HTTP/1.1\r\n'
+        b'Host: content.test-domain.com\r\n'
+        b'\r\n'
+    )
+    request: Request = Request(
+        method=RequestMethod.get,
+        target='http://content.test-domain.com/',
+        http_version='HTTP/1.1',
+        headers={
+            'Host': 'content.test-domain.com'
+        },
+        hostname='content.test-domain.com',
+        keep_alive=True
+    )
+    response_bytes: bytes = (
+        b'HTTP/1.1 204 No Content\r\n'
+        b'\r\n'
+    )
+    proxy_mock.read_until.return_value = response_bytes
+    proxy_mock.is_reusable.return_value = True
+    request_adapter_mock.adapt_request_from_bytes.return_value = request
+    request_adapter_mock.adapt_request_to_bytes.return_value = request_bytes
+    client_reader_mock.readuntil.side_effect = [request_bytes, request_bytes, CLIENT_CLOSED]
+    proxy_server: ProxyServer = ProxyServer(
+        proxy_config_file_path=proxy_config_file_path_mock,
+        proxy_router=proxy_router_mock,
+        timeout_seconds=TIMEOUT_SECONDS,
+        buffer_size_bytes=BUFFER_SIZE_BYTES,
+        request_adapter=request_adapter_mock
+    )
+    with patch.object(target=TypeAdapter, attribute=TypeAdapter.validate_json.__name__, return_value=[proxy_mock]):
+        await proxy_server.handle_request(client_reader=client_reader_mock, client_writer=client_writer_mock)
+        assert request_adapter_mock.adapt_request_from_bytes.call_args_list == [call(request_bytes)] * 2
+        assert proxy_mock.write.await_args_list == [call(request_bytes)] * 2
+        proxy_mock.connect.assert_awaited_once()
+        assert client_reader_mock.readuntil.await_count == 3
+        assert client_writer_mock.write.call_args_list == [call(response_bytes)] * 2
+        client_writer_mock.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_request_http_keep_alive_max_requests(
+    proxy_config_file_path_mock: Path,
+    proxy_mock: AsyncMock,
+    proxy_router_mock: AsyncMock,
+    request_adapter_mock: Mock,
+    client_reader_mock: AsyncMock,
+    client_writer_mock: AsyncMock
+) -> None:
+    request: Request = Request(
+        method=RequestMethod.get,
+        target='http://content.test-domain.com/',
+        http_version='HTTP/1.1',
+        headers={
+            'Host': 'content.test-domain.com'
+        },
+        hostname='content.test-domain.com',
+        keep_alive=True
+    )
+    proxy_mock.read_until.return_value = b'HTTP/1.1 204 No Content\r\n\r\n'
+    proxy_mock.is_reusable.return_value = True
+    request_adapter_mock.adapt_request_from_bytes.return_value = request
+    client_reader_mock.readuntil.return_value = b'GET http://content.test-domain.com/ HTTP/1.1\r\n\r\n'
+    proxy_server: ProxyServer = ProxyServer(
+        proxy_config_file_path=proxy_config_file_path_mock,
+        proxy_router=proxy_router_mock,
+        request_adapter=request_adapter_mock,
+        keep_alive_max_requests=3
+    )
+    with patch.object(target=TypeAdapter, attribute=TypeAdapter.validate_json.__name__, return_value=[proxy_mock]):
+        await proxy_server.handle_request(client_reader=client_reader_mock, client_writer=client_writer_mock)
+        assert proxy_mock.write.await_count == 3
+        assert client_reader_mock.readuntil.await_count == 3
+        client_writer_mock.close.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_handle_request_https(
     proxy_config_file_path_mock: Path,
@@ -187,7 +394,7 @@ async def test_handle_request_https(
         },
         hostname='web.test-domain.com'
     )
-    proxy_mock.read.side_effect = [
+    proxy_mock.read_available.side_effect = [
         (
             b'HTTP/1.1 200 Connection Established\r\n'
             b'\r\n'
@@ -201,11 +408,12 @@ async def test_handle_request_https(
         ),
         b''
     ]
+    proxy_mock.write_buffered.return_value = True
     proxy_router_mock.route_request_to_proxy.return_value = 'test-proxy'
     request_adapter_mock.adapt_request_from_bytes.return_value = request_connect
     request_adapter_mock.adapt_request_to_bytes.return_value = request_bytes_connect
+    client_reader_mock.readuntil.return_value = request_bytes_connect
     client_reader_mock.read.side_effect = [
-        request_bytes_connect,
         (
             b'GET / HTTP/1.1\r\n'
             b'Host: web.test-domain.com\r\n'
@@ -214,6 +422,8 @@ async def test_handle_request_https(
         ),
         b''
     ]
+    client_writer_mock.is_closing.return_value = False
+    client_writer_mock.transport.get_write_buffer_size.return_value = 0
     proxy_server: ProxyServer = ProxyServer(
         proxy_config_file_path=proxy_config_file_path_mock,
         proxy_router=proxy_router_mock,
@@ -228,8 +438,9 @@ async def test_handle_request_https(
             timeout_seconds=TIMEOUT_SECONDS,
             buffer_size_bytes=BUFFER_SIZE_BYTES
         )
-        assert proxy_mock.read.await_count == 3
-        assert proxy_mock.write.await_count == 2
+        assert proxy_mock.read_available.await_count == 3
+        proxy_mock.write.assert_awaited_once_with(request_bytes_connect)
+        assert proxy_mock.write_buffered.await_count == 1
         proxy_mock.close.assert_awaited_once()
         proxy_router_mock.route_request_to_proxy.assert_awaited_once_with(request_connect)
         request_adapter_mock.adapt_request_from_bytes.assert_called_once_with(request_bytes_connect)
@@ -238,15 +449,15 @@ async def test_handle_request_https(
             authentication_id=proxy_mock.authentication_id,
             request=request_connect
         )
+        client_reader_mock.readuntil.assert_awaited_once_with(b'\r\n\r\n')
         client_reader_mock.read.assert_awaited_with(BUFFER_SIZE_BYTES)
-        assert client_reader_mock.read.await_count == 3
+        assert client_reader_mock.read.await_count == 2
         assert client_writer_mock.write.call_count == 2
-        assert client_writer_mock.drain.await_count == 2
+        client_writer_mock.drain.assert_not_awaited()
         client_writer_mock.close.assert_called_once()
         client_writer_mock.wait_closed.assert_awaited_once()
 
 
-
 @pytest.mark.asyncio
 async def test_handle_request_empty_request(
     proxy_config_file_path_mock: Path,
@@ -255,6 +466,7 @@ async def test_handle_request_empty_request(
     client_reader_mock: AsyncMock,
     client_writer_mock: AsyncMock
 ) -> None:
+    client_reader_mock.readuntil.side_effect = CLIENT_CLOSED
     request_adapter_mock.adapt_request_from_bytes.return_value = None
     proxy_server: ProxyServer = ProxyServer(
         proxy_config_file_path=proxy_config_file_path_mock,
@@ -264,9 +476,9 @@ async def test_handle_request_empty_request(
     )
     await proxy_server.handle_request(client_reader=client_reader_mock, client_writer=client_writer_mock)
     proxy_router_mock.route_request_to_proxy.assert_not_awaited()
-    request_adapter_mock.adapt_request_from_bytes.assert_called_once()
+    request_adapter_mock.adapt_request_from_bytes.assert_called_once_with(None)
     request_adapter_mock.adapt_request_to_bytes.assert_not_called()
-    client_reader_mock.read.assert_awaited_once_with(BUFFER_SIZE_BYTES)
+    client_reader_mock.readuntil.assert_awaited_once_with(b'\r\n\r\n')
     client_writer_mock.write.assert_not_called()
     client_writer_mock.drain.assert_not_awaited()
     client_writer_mock.close.assert_called_once()
@@ -299,7 +511,7 @@ async def test_handle_request_proxy_not_found(
     )
     proxy_router_mock.route_request_to_proxy.return_value = 'test-proxy'
     request_adapter_mock.adapt_request_from_bytes.return_value = request
-    client_reader_mock.read.return_value = request_bytes
+    client_reader_mock.readuntil.return_value = request_bytes
     proxy_server: ProxyServer = ProxyServer(
         proxy_config_file_path=proxy_config_file_path_mock,
         proxy_router=proxy_router_mock,
@@ -312,7 +524,7 @@ async def test_handle_request_proxy_not_found(
         proxy_router_mock.route_request_to_proxy.assert_awaited_once_with(request)
         request_adapter_mock.adapt_request_from_bytes.assert_called_once_with(request_bytes)
         request_adapter_mock.adapt_request_to_bytes.assert_not_called()
-        client_reader_mock.read.assert_awaited_once_with(BUFFER_SIZE_BYTES)
+        client_reader_mock.readuntil.assert_awaited_once_with(b'\r\n\r\n')
         client_writer_mock.write.assert_not_called()
         client_writer_mock.drain.assert_not_awaited()
         client_writer_mock.close.assert_called_once()
@@ -1,7 +1,9 @@
 import pytest
 
+from proxy_server.domain.message_framing import MessageFraming
 from proxy_server.domain.request import Request
 from proxy_server.domain.request_method import RequestMethod
+from proxy_server.exceptions.invalid_request_exception import InvalidRequestException
 from proxy_server.request_adapter import RequestAdapter
 
 
@@ -30,7 +32,8 @@ def test_adapt_request_from_bytes_with_valid_request_no_body(request_adapter: Re
         'Host': 'example.com',
         'User-Agent': 'test-agent'
     }
-    assert request.body is None
+    assert request.framing == MessageFraming.no_body
+    assert request.content_length is None
     assert request.hostname == 'example.com'
 
 
@@ -41,7 +44,6 @@ def test_adapt_request_from_bytes_with_valid_request_with_body(request_adapter:
         b'Content-Type: application/json\r\n'
         b'Content-Length: 16\r\n'
         b'\r\n'
-        b'{"key": "value"}'
     )
     request: Request = request_adapter.adapt_request_from_bytes(request_bytes)
     assert request is not None
@@ -53,22 +55,43 @@ def test_adapt_request_from_bytes_with_valid_request_with_body(request_adapter:
         'Content-Type': 'application/json',
         'Content-Length': '16'
     }
-    assert request.body == '{"key": "value"}'
+    assert request.framing == MessageFraming.content_length
+    assert request.content_length == 16
     assert request.hostname == 'api.example.com'
 
 
-def test_adapt_request_from_bytes_with_multiline_body(request_adapter: RequestAdapter) -> None:
+def test_adapt_request_from_bytes_with_chunked_body(request_adapter: RequestAdapter) -> None:
     request_bytes: bytes = (
         b'POST /submit HTTP/1.1\r\n'
         b'Host: api.example.com\r\n'
+        b'Transfer-Encoding: chunked\r\n'
+        b'Content-Length: 16\r\n'
         b'\r\n'
-        b'line1\n'
-        b'line2\n'
-        b'line3'
     )
     request: Request = request_adapter.adapt_request_from_bytes(request_bytes)
-    assert request is not None
-    assert request.body == 'line1\nline2\nline3'
+    assert request.framing == MessageFraming.chunked
+    assert request.content_length is None
+
+
+@pytest.mark.parametrize(
+    argnames='framing_header',
+    argvalues=[b'Transfer-Encoding: gzip', b'Content-Length: -1', b'Content-Length: 16, 16']
+)
+def test_adapt_request_from_bytes_with_invalid_framing(request_adapter: RequestAdapter, framing_header: bytes) -> None:
+    request_bytes: bytes = b'POST /submit HTTP/1.1\r\nHost: api.example.com\r\n' + framing_header + b'\r\n\r\n'
+    with pytest.raises(InvalidRequestException):
+        request_adapter.adapt_request_from_bytes(request_bytes)
+
+
+def test_adapt_request_from_bytes_with_non_utf8_header(request_adapter: RequestAdapter) -> None:
+    request_bytes: bytes = (
+        b'GET /path HTTP/1.1\r\n'
+        b'Host: example.com\r\n'
+        b'X-Name: caf\xe9\r\n'
+        b'\r\n'
+    )
+    request: Request = request_adapter.adapt_request_from_bytes(request_bytes)
+    assert request_adapter.adapt_request_to_bytes(request) == request_bytes
 
 
 def test_adapt_request_from_bytes_with_host_in_headers(request_adapter: RequestAdapter) -> None:
@@ -100,7 +123,7 @@ def test_adapt_request_from_bytes_with_host_with_port(request_adapter: RequestAd
     assert request.hostname == 'host-with-port.com'
 
 
-def test_adapt_request_to_bytes_with_no_body(request_adapter: RequestAdapter) -> None:
+def test_adapt_request_to_bytes(request_adapter: RequestAdapter) -> None:
     request: Request = Request(
         method=RequestMethod.get,
         target='/index.html',
@@ -109,7 +132,6 @@ def test_adapt_request_to_bytes_with_no_body(request_adapter: RequestAdapter) ->
             'Host': 'example.com',
             'User-Agent': 'test-agent'
         },
-        body=None,
         hostname='example.com'
     )
     expected_bytes: bytes = (
@@ -121,35 +143,12 @@ def test_adapt_request_to_bytes_with_no_body(request_adapter: RequestAdapter) ->
     assert request_adapter.adapt_request_to_bytes(request) == expected_bytes
 
 
-def test_adapt_request_to_bytes_with_body(request_adapter: RequestAdapter) -> None:
-    request: Request = Request(
-        method=RequestMethod.post,
-        target='/submit',
-        http_version='HTTP/1.1',
-        headers={
-            'Host': 'api.example.com',
-            'Content-Type': 'application/json'
-        },
-        body='{"key": "value"}',
-        hostname='api.example.com'
-    )
-    expected_bytes: bytes = (
-        b'POST /submit HTTP/1.1\r\n'
-        b'Host: api.example.com\r\n'
-        b'Content-Type: application/json\r\n'
-        b'\r\n'
-        b'{"key": "value"}'
-    )
-    assert request_adapter.adapt_request_to_bytes(request) == expected_bytes
-
-
 def test_adapt_request_to_bytes_with_empty_headers(request_adapter: RequestAdapter) -> None:
     request: Request = Request(
         method=RequestMethod.get,
         target='/',
         http_version='HTTP/1.1',
         headers={},
-        body=None,
         hostname='example.com'
     )
     expected_bytes: bytes = b'GET / HTTP/1.1\r\n\r\n'
@@ -161,9 +160,70 @@ def test_round_trip_conversion(request_adapter: RequestAdapter) -> None:
         b'POST /api HTTP/1.1\r\n'
         b'Host: test.com\r\n'
         b'Content-Type: text/plain\r\n'
+        b'Content-Length: 9\r\n'
         b'\r\n'
-        b'test body'
     )
     request: Request = request_adapter.adapt_request_from_bytes(original_bytes)
     converted_bytes: bytes = request_adapter.adapt_request_to_bytes(request)
     assert converted_bytes == original_bytes
+
+
+
+def test_round_trip_conversion_preserves_raw_headers(request_adapter: RequestAdapter) -> None:
+    original_bytes: bytes = (
+        b'GET / HTTP/1.1\r\n'
+        b'host:test.com\r\n'
+        b'Cookie: a=1\r\n'
+        b'X-Custom:  spaced value\r\n'
+        b'Cookie: b=2\r\n'
+        b'\r\n'
+    )
+    request: Request = request_adapter.adapt_request_from_bytes(original_bytes)
+    assert request_adapter.adapt_request_to_bytes(request) == original_bytes
+
+
+def test_adapt_request_to_bytes_with_header_overrides(request_adapter: RequestAdapter) -> None:
+    request: Request = request_adapter.adapt_request_from_bytes(
+        b'GET http://test.com/ HTTP/1.1\r\n'
+        b'Host: test.com\r\n'
+        b'proxy-authorization: Basic stale\r\n'
+        b'Cookie: a=1\r\n'
+        b'Cookie: b=2\r\n'
+        b'\r\n'
+    )
+    request.header_overrides['Proxy-Authorization'] = b'Basic dGVzdA=='
+    expected_bytes: bytes = (
+        b'GET http://test.com/ HTTP/1.1\r\n'
+        b'Host: test.com\r\n'
+        b'Cookie: a=1\r\n'
+        b'Cookie: b=2\r\n'
+        b'Proxy-Authorization: Basic dGVzdA==\r\n'
+        b'\r\n'
+    )
+    assert request_adapter.adapt_request_to_bytes(request) == expected_bytes
+
+
+def test_adapt_request_to_bytes_with_header_overrides_and_no_headers(request_adapter: RequestAdapter) -> None:
+    request: Request = request_adapter.adapt_request_from_bytes(b'CONNECT test.com:443 HTTP/1.1\r\n\r\n')
+    request.header_overrides['Proxy-Authorization'] = b'Basic dGVzdA=='
+    expected_bytes: bytes = b'CONNECT test.com:443 HTTP/1.1\r\nProxy-Authorization: Basic dGVzdA==\r\n\r\n'
+    assert request_adapter.adapt_request_to_bytes(request) == expected_bytes
+
+@pytest.mark.parametrize(
+    argnames=('request_bytes', 'keep_alive'),
+    argvalues=[
+        (b'GET / HTTP/1.1\r\nHost: example.com\r\n\r\n', True),
+        (b'GET / HTTP/1.1\r\nHost: example.com\r\nConnection: close\r\n\r\n', False),
+        (b'GET / HTTP/1.1\r\nHost: example.com\r\nProxy-Connection: close\r\n\r\n', False),
+        (b'GET / HTTP/1.0\r\nHost: example.com\r\n\r\n', False),
+        (b'GET / HTTP/1.0\r\nHost: example.com\r\nProxy-Connection: Keep-Alive\r\n\r\n', True),
+        (b'POST / HTTP/1.1\r\nHost: example.com\r\nTransfer-Encoding: chunked\r\n\r\n', True)
+    ]
+)
+def test_adapt_request_from_bytes_keep_alive(
+    request_adapter: RequestAdapter,
+    request_bytes: bytes,
+    keep_alive: bool
+) -> None:
+    request: Request = request_adapter.adapt_request_from_bytes(request_bytes)
+    assert request.keep_alive == keep_alive
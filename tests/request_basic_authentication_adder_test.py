@@ -41,9 +41,9 @@ async def test_add_authentication_to_request(
         authentication_id='test-auth-id',
         request=request
     )
-    expected_token = base64.b64encode(f'{USERNAME}:{PASSWORD}'.encode()).decode()
-    assert request.headers.get('Proxy-Authorization') is not None
-    assert request.headers.get('Proxy-Authorization') == f'Basic {expected_token}'
+    expected_token: bytes = base64.b64encode(f'{USERNAME}:{PASSWORD}'.encode())
+    assert request.header_overrides.get('Proxy-Authorization') is not None
+    assert request.header_overrides.get('Proxy-Authorization') == b'Basic ' + expected_token
 
 
 @pytest.mark.asyncio
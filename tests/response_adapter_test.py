@@ -0,0 +1,134 @@
+import pytest
+
+from proxy_server.domain.message_framing import MessageFraming
+from proxy_server.domain.request_method import RequestMethod
+from proxy_server.domain.response import Response
+from proxy_server.response_adapter import ResponseAdapter
+
+
+@pytest.fixture(scope='function')
+def response_adapter() -> ResponseAdapter:
+    return ResponseAdapter()
+
+
+def test_adapt_response_from_bytes_with_content_length(response_adapter: ResponseAdapter) -> None:
+    response_bytes: bytes = (
+        b'HTTP/1.1 200 OK\r\n'
+        b'Content-Type: text/plain\r\n'
+        b'Content-Length: 31\r\n'
+        b'\r\n'
+    )
+    response: Response = response_adapter.adapt_response_from_bytes(
+        response=response_bytes,
+        request_method=RequestMethod.get
+    )
+    assert response.http_version == 'HTTP/1.1'
+    assert response.status_code == 200
+    assert response.reason == 'OK'
+    assert response.headers == {
+        'content-type': 'text/plain',
+        'content-length': '31'
+    }
+    assert response.framing == MessageFraming.content_length
+    assert response.content_length == 31
+    assert response.keep_alive
+
+
+def test_adapt_response_from_bytes_with_chunked_transfer_encoding(response_adapter: ResponseAdapter) -> None:
+    response_bytes: bytes = (
+        b'HTTP/1.1 200 OK\r\n'
+        b'Transfer-Encoding: gzip, chunked\r\n'
+        b'Content-Length: 31\r\n'
+        b'\r\n'
+    )
+    response: Response = response_adapter.adapt_response_from_bytes(
+        response=response_bytes,
+        request_method=RequestMethod.get
+    )
+    assert response.framing == MessageFraming.chunked
+    assert response.content_length is None
+    assert response.keep_alive
+
+
+def test_adapt_response_from_bytes_without_length(response_adapter: ResponseAdapter) -> None:
+    response_bytes: bytes = (
+        b'HTTP/1.1 200 OK\r\n'
+        b'Content-Type: text/plain\r\n'
+        b'\r\n'
+    )
+    response: Response = response_adapter.adapt_response_from_bytes(
+        response=response_bytes,
+        request_method=RequestMethod.get
+    )
+    assert response.framing == MessageFraming.until_close
+    assert not response.keep_alive
+
+
+def test_adapt_response_from_bytes_with_connection_close(response_adapter: ResponseAdapter) -> None:
+    response_bytes: bytes = (
+        b'HTTP/1.1 200 OK\r\n'
+        b'Content-Length: 0\r\n'
+        b'Connection: close\r\n'
+        b'\r\n'
+    )
+    response: Response = response_adapter.adapt_response_from_bytes(
+        response=response_bytes,
+        request_method=RequestMethod.get
+    )
+    assert response.framing == MessageFraming.content_length
+    assert not response.keep_alive
+
+
+@pytest.mark.parametrize(
+    argnames=('connection_header', 'keep_alive'),
+    argvalues=[(b'', False), (b'Connection: Keep-Alive\r\n', True)]
+)
+def test_adapt_response_from_bytes_with_http_1_0(
+    response_adapter: ResponseAdapter,
+    connection_header: bytes,
+    keep_alive: bool
+) -> None:
+    response_bytes: bytes = b'HTTP/1.0 200 OK\r\nContent-Length: 5\r\n' + connection_header + b'\r\n'
+    response: Response = response_adapter.adapt_response_from_bytes(
+        response=response_bytes,
+        request_method=RequestMethod.get
+    )
+    assert response.keep_alive == keep_alive
+
+
+@pytest.mark.parametrize(
+    argnames=('status_line', 'request_method'),
+    argvalues=[
+        (b'HTTP/1.1 200 OK', RequestMethod.head),
+        (b'HTTP/1.1 100 Continue', RequestMethod.post),
+        (b'HTTP/1.1 204 No Content', RequestMethod.delete),
+        (b'HTTP/1.1 304 Not Modified', RequestMethod.get)
+    ]
+)
+def test_adapt_response_from_bytes_without_body(
+    response_adapter: ResponseAdapter,
+    status_line: bytes,
+    request_method: RequestMethod
+) -> None:
+    response_bytes: bytes = status_line + b'\r\nContent-Length: 42\r\n\r\n'
+    response: Response = response_adapter.adapt_response_from_bytes(
+        response=response_bytes,
+        request_method=request_method
+    )
+    assert response.framing == MessageFraming.no_body
+    assert response.keep_alive
+
+
+def test_adapt_response_from_bytes_with_switching_protocols(response_adapter: ResponseAdapter) -> None:
+    response_bytes: bytes = (
+        b'HTTP/1.1 101 Switching Protocols\r\n'
+        b'Upgrade: websocket\r\n'
+        b'Connection: Upgrade\r\n'
+        b'\r\n'
+    )
+    response: Response = response_adapter.adapt_response_from_bytes(
+        response=response_bytes,
+        request_method=RequestMethod.get
+    )
+    assert response.framing == MessageFraming.tunnel
+    assert not response.keep_alive
@@ -0,0 +1,191 @@
+import asyncio
+import time
+from asyncio import Server, StreamReader, StreamWriter
+from typing import Awaitable, Callable
+from unittest.mock import AsyncMock
+
+import pytest
+
+from proxy_server.domain.client import Client
+from proxy_server.domain.connection import Connection
+from proxy_server.tunnel_engine import TunnelEngine
+
+
+MIN_CHUNK_SIZE_BYTES: int = 4096
+MAX_CHUNK_SIZE_BYTES: int = 262144
+HIGH_WATER_MARK_BYTES: int = 262144
+BENCHMARK_SIZE_BYTES: int = 64 * 1024 * 1024
+
+
+@pytest.fixture(scope='function')
+def tunnel_engine() -> TunnelEngine:
+    return TunnelEngine(
+        min_chunk_size_bytes=MIN_CHUNK_SIZE_BYTES,
+        max_chunk_size_bytes=MAX_CHUNK_SIZE_BYTES,
+        high_water_mark_bytes=HIGH_WATER_MARK_BYTES
+    )
+
+
+@pytest.fixture(scope='function')
+def client_mock() -> AsyncMock:
+    client: AsyncMock = AsyncMock(spec=Connection)
+    client.write_buffered.return_value = True
+    return client
+
+
+@pytest.fixture(scope='function')
+def proxy_mock() -> AsyncMock:
+    proxy: AsyncMock = AsyncMock(spec=Connection)
+    proxy.write_buffered.return_value = True
+    return proxy
+
+
+@pytest.mark.asyncio
+async def test_tunnel(tunnel_engine: TunnelEngine, client_mock: AsyncMock, proxy_mock: AsyncMock) -> None:
+    client_mock.read_available.side_effect = [b'Hello', b'']
+    proxy_mock.read_available.side_effect = [b'world!', b'']
+    await tunnel_engine.tunnel(client=client_mock, proxy=proxy_mock, idle_timeout_seconds=1.0)
+    proxy_mock.write_buffered.assert_awaited_once_with(data=b'Hello', high_water_mark_bytes=HIGH_WATER_MARK_BYTES)
+    client_mock.write_buffered.assert_awaited_once_with(data=b'world!', high_water_mark_bytes=HIGH_WATER_MARK_BYTES)
+
+
+@pytest.mark.asyncio
+async def test_tunnel_adapts_chunk_size(
+    tunnel_engine: TunnelEngine,
+    client_mock: AsyncMock,
+    proxy_mock: AsyncMock
+) -> None:
+    client_mock.read_available.side_effect = lambda max_size_bytes: b'x' * max_size_bytes
+    proxy_mock.write_buffered.side_effect = [True] * 8 + [False]
+    proxy_mock.read_available.return_value = b''
+    await tunnel_engine.tunnel(client=client_mock, proxy=proxy_mock, idle_timeout_seconds=1.0)
+    assert [x.args[0] for x in client_mock.read_available.await_args_list] == [
+        4096, 8192, 16384, 32768, 65536, 131072, 262144, 262144, 262144
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tunnel_stops_when_destination_is_closed(
+    tunnel_engine: TunnelEngine,
+    client_mock: AsyncMock,
+    proxy_mock: AsyncMock
+) -> None:
+    client_mock.read_available.return_value = b'Hello'
+    proxy_mock.read_available.side_effect = ConnectionResetError
+    proxy_mock.write_buffered.return_value = False
+    await tunnel_engine.tunnel(client=client_mock, proxy=proxy_mock, idle_timeout_seconds=1.0)
+    client_mock.read_available.assert_awaited_once()
+    client_mock.write_buffered.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tunnel_idle_timeout(tunnel_engine: TunnelEngine, client_mock: AsyncMock, proxy_mock: AsyncMock) -> None:
+    read_events: list[asyncio.Event] = [asyncio.Event(), asyncio.Event()]
+
+    async def read_forever(max_size_bytes: int) -> bytes:
+        await read_events.pop().wait()
+        return b''
+
+    client_mock.read_available.side_effect = read_forever
+    proxy_mock.read_available.side_effect = read_forever
+    started_at: float = time.monotonic()
+    await tunnel_engine.tunnel(client=client_mock, proxy=proxy_mock, idle_timeout_seconds=0.05)
+    assert time.monotonic() - started_at < 1.0
+    proxy_mock.write_buffered.assert_not_awaited()
+    client_mock.write_buffered.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tunnel_idle_timeout_is_extended_by_activity(
+    tunnel_engine: TunnelEngine,
+    client_mock: AsyncMock,
+    proxy_mock: AsyncMock
+) -> None:
+    remaining_reads: list[bytes] = [b''] + [b'tick'] * 5
+
+    async def read_slowly(max_size_bytes: int) -> bytes:
+        await asyncio.sleep(0.03)
+        return remaining_reads.pop()
+
+    client_mock.read_available.side_effect = read_slowly
+    proxy_mock.read_available.return_value = b''
+    await tunnel_engine.tunnel(client=client_mock, proxy=proxy_mock, idle_timeout_seconds=0.05)
+    assert proxy_mock.write_buffered.await_count == 5
+
+
+async def _measure_loopback_tunnel(
+    tunnel: Callable[[Connection, Connection], Awaitable[None]],
+    size_bytes: int
+) -> tuple[float, float]:
+    received_size_bytes: list[int] = []
+
+    async def handle_origin(reader: StreamReader, writer: StreamWriter) -> None:
+        received: int = 0
+        while received < size_bytes and (data := await reader.read(MAX_CHUNK_SIZE_BYTES)):
+            received += len(data)
+        received_size_bytes.append(received)
+        writer.close()
+
+    async def handle_tunnel(reader: StreamReader, writer: StreamWriter) -> None:
+        origin_reader: StreamReader
+        origin_writer: StreamWriter
+        origin_reader, origin_writer = await asyncio.open_connection(host='127.0.0.1', port=origin_port)
+        client: Client = Client(reader=reader, writer=writer, buffer_size_bytes=MIN_CHUNK_SIZE_BYTES)
+        proxy: Client = Client(reader=origin_reader, writer=origin_writer, buffer_size_bytes=MIN_CHUNK_SIZE_BYTES)
+        await tunnel(client, proxy)
+        await proxy.close()
+        await client.close()
+
+    origin_server: Server = await asyncio.start_server(client_connected_cb=handle_origin, host='127.0.0.1', port=0)
+    origin_port: int = origin_server.sockets[0].getsockname()[1]
+    tunnel_server: Server = await asyncio.start_server(client_connected_cb=handle_tunnel, host='127.0.0.1', port=0)
+    tunnel_port: int = tunnel_server.sockets[0].getsockname()[1]
+    payload: bytes = b'x' * MAX_CHUNK_SIZE_BYTES
+    async with origin_server, tunnel_server:
+        started_at: float = time.perf_counter()
+        started_at_cpu: float = time.process_time()
+        reader: StreamReader
+        writer: StreamWriter
+        reader, writer = await asyncio.open_connection(host='127.0.0.1', port=tunnel_port)
+        sent_size_bytes: int = 0
+        while sent_size_bytes < size_bytes:
+            writer.write(payload)
+            await writer.drain()
+            sent_size_bytes += len(payload)
+        await reader.read()
+        writer.close()
+        elapsed_seconds: float = time.perf_counter() - started_at
+        elapsed_cpu_seconds: float = time.process_time() - started_at_cpu
+    assert received_size_bytes == [size_bytes]
+    return size_bytes / elapsed_seconds / 1e6, elapsed_cpu_seconds / (size_bytes / 1e9)
+
+
+@pytest.mark.asyncio
+async def test_tunnel_loopback_benchmark(tunnel_engine: TunnelEngine) -> None:
+    async def legacy_tunnel(client: Connection, proxy: Connection) -> None:
+        async def pipe(source: Connection, destination: Connection) -> None:
+            while data := await source.read():
+                await destination.write(data)
+
+        await asyncio.gather(pipe(source=client, destination=proxy), pipe(source=proxy, destination=client))
+
+    async def engine_tunnel(client: Connection, proxy: Connection) -> None:
+        await tunnel_engine.tunnel(client=client, proxy=proxy, idle_timeout_seconds=60.0)
+
+    legacy_throughput_mb_per_second: float
+    legacy_cpu_seconds_per_gb: float
+    legacy_throughput_mb_per_second, legacy_cpu_seconds_per_gb = await _measure_loopback_tunnel(
+        tunnel=legacy_tunnel,
+        size_bytes=BENCHMARK_SIZE_BYTES
+    )
+    engine_throughput_mb_per_second: float
+    engine_cpu_seconds_per_gb: float
+    engine_throughput_mb_per_second, engine_cpu_seconds_per_gb = await _measure_loopback_tunnel(
+        tunnel=engine_tunnel,
+        size_bytes=BENCHMARK_SIZE_BYTES
+    )
+    print(
+        f'\nLoopback tunnel, {BENCHMARK_SIZE_BYTES // 1024 // 1024} MiB: '
+        f'read/write loop {legacy_throughput_mb_per_second:.0f} MB/s, {legacy_cpu_seconds_per_gb:.2f} CPU s/GB; '
+        f'tunnel engine {engine_throughput_mb_per_second:.0f} MB/s, {engine_cpu_seconds_per_gb:.2f} CPU s/GB'
+    )